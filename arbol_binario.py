@@ -0,0 +1,251 @@
+import sys
+import mmap
+import struct
+from array import array
+from typing import Any, Dict, List, Optional
+
+from ll1_parser import parse
+from ll1_parser_tree import Node
+from semantica import Oyente
+from gramaticas import GRAMATICA_POR_DEFECTO
+
+# ============================================================
+# Formato binario del árbol de derivación (.llt)
+#   Los nodos se guardan en preorden, que es justamente el orden en
+#   que el bucle LL(1) expande/consume: un escritor puede ir como
+#   oyente de parse() sin construir ningún Node.
+#
+#   cabecera  'LLT1' u32 n_nodos u32 n_simbolos u32 n_cadenas
+#   símbolos  u32 desplazamientos[n_simbolos + 1] + utf-8
+#   cadenas   u32 desplazamientos[n_cadenas + 1] + u8 etiqueta[n_cadenas] + utf-8
+#   nodos     u32 fin[n] | i32 lexema[n] | u16 simbolo[n]
+#
+#   fin[i] es el índice siguiente al subárbol de i: los hijos de i
+#   son i+1, fin[i+1], ... hasta fin[i]. lexema[i] indexa la tabla
+#   de cadenas (-1: sin lexema); la etiqueta dice si era str o int.
+#   Todo en little-endian, con cada sección alineada a 4 bytes.
+# ============================================================
+
+MAGIA = b"LLT1"
+_CABECERA = struct.Struct("<4sIII")
+_STR, _INT = 0, 1
+
+class _Tablas:
+    """Arreglos del formato en memoria (sin objetos por nodo)."""
+
+    def __init__(self):
+        self.simbolo = array("H")
+        self.fin = array("I")
+        self.lexema = array("i")
+        self.simbolos: Dict[str, int] = {}
+        self.cadenas: Dict[Any, int] = {}
+        self._abiertos: List[List[int]] = []     # [índice, hijos restantes]
+
+    def nodo(self, label: str, hijos: int, lexema=None):
+        i = len(self.simbolo)
+        codigo = self.simbolos.setdefault(label, len(self.simbolos))
+        self.simbolo.append(codigo)
+        self.fin.append(0)
+        if lexema is None:
+            self.lexema.append(-1)
+        else:
+            clave = (type(lexema) is int, lexema)
+            self.lexema.append(self.cadenas.setdefault(clave, len(self.cadenas)))
+        if hijos:
+            self._abiertos.append([i, hijos])
+            return
+        # hoja: cierra el nodo y a los padres que quedaron completos
+        self.fin[i] = i + 1
+        abiertos = self._abiertos
+        while abiertos:
+            tope = abiertos[-1]
+            tope[1] -= 1
+            if tope[1]:
+                break
+            self.fin[tope[0]] = len(self.simbolo)
+            abiertos.pop()
+
+    def escribir(self, path: str):
+        with open(path, "wb") as f:
+            f.write(_CABECERA.pack(MAGIA, len(self.simbolo), len(self.simbolos), len(self.cadenas)))
+            _escribir_textos(f, list(self.simbolos))
+            textos = [str(v) for (_, v) in self.cadenas]
+            _escribir_textos(f, textos, bytes(_INT if es_int else _STR for (es_int, _) in self.cadenas))
+            for a in (self.fin, self.lexema, self.simbolo):
+                _escribir_arreglo(f, a)
+
+def _escribir_arreglo(f, a: array):
+    if sys.byteorder != "little":
+        a = array(a.typecode, a); a.byteswap()
+    f.write(a.tobytes())
+    f.write(b"\0" * (-f.tell() % 4))
+
+def _escribir_textos(f, textos: List[str], etiquetas: bytes = b""):
+    blobs = [t.encode("utf-8") for t in textos]
+    desp = array("I", [0])
+    for b in blobs:
+        desp.append(desp[-1] + len(b))
+    _escribir_arreglo(f, desp)
+    f.write(etiquetas)
+    f.write(b"".join(blobs))
+    f.write(b"\0" * (-f.tell() % 4))
+
+class EscritorArbol(Oyente):
+    """Oyente de parse(): arma el .llt directamente desde los eventos del bucle predictivo."""
+
+    def __init__(self):
+        self.tablas = _Tablas()
+
+    def al_expandir(self, A, produccion, tok, pila):
+        self.tablas.nodo(A, 0 if produccion == ['vacia'] else len(produccion))
+
+    def al_consumir(self, X, tok, pila):
+        valor = getattr(tok, "value", None)
+        self.tablas.nodo(X, 0, tok.type if valor is None else valor)
+
+    def escribir(self, path: str):
+        self.tablas.escribir(path)
+
+def guardar(codigo: str, path: str, gramatica: str = GRAMATICA_POR_DEFECTO) -> bool:
+    """Parsea `codigo` y, si es aceptado, escribe su árbol en `path` sin construir Nodes."""
+    esc = EscritorArbol()
+    ok = parse(codigo, trazar=False, gramatica=gramatica, oyente=esc)
+    if ok:
+        esc.escribir(path)
+    return ok
+
+def escribir(raiz: Node, path: str):
+    """Escribe un árbol ya construido (p.ej. el de parse_with_tree)."""
+    t = _Tablas()
+    pendientes = [raiz]
+    while pendientes:
+        n = pendientes.pop()
+        t.nodo(n.label, len(n.children), n.lexeme if n.token_type else None)
+        pendientes.extend(reversed(n.children))
+    t.escribir(path)
+
+# ===== Lectura perezosa =====
+class NodoVista:
+    """Vista de un nodo del archivo; expone la misma interfaz que Node (label, token_type, lexeme, children)."""
+
+    __slots__ = ("_arbol", "indice")
+
+    def __init__(self, arbol: "ArbolBinario", indice: int):
+        self._arbol = arbol
+        self.indice = indice
+
+    @property
+    def label(self) -> str:
+        return self._arbol.simbolo_de(self.indice)
+
+    @property
+    def lexeme(self):
+        return self._arbol.lexema_de(self.indice)
+
+    @property
+    def token_type(self) -> Optional[str]:
+        return self.label if self._arbol.lexema[self.indice] >= 0 else None
+
+    @property
+    def children(self) -> List["NodoVista"]:
+        return [NodoVista(self._arbol, j) for j in self._arbol.hijos(self.indice)]
+
+    def materializar(self) -> Node:
+        """Convierte el subárbol en Nodes."""
+        a = self._arbol
+        raiz = Node(self.label, self.token_type, self.lexeme)
+        pendientes = [(self.indice, raiz)]
+        while pendientes:
+            i, n = pendientes.pop()
+            for j in a.hijos(i):
+                lex = a.lexema_de(j)
+                pendientes.append((j, n.add(Node(a.simbolo_de(j), a.simbolo_de(j) if a.lexema[j] >= 0 else None, lex))))
+        return raiz
+
+    def __repr__(self):
+        return f"NodoVista({self.indice}, {self.label!r})"
+
+class ArbolBinario:
+    """Lee un .llt con mmap; nodos y lexemas se decodifican recién al accederlos."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mv = memoryview(self._mmap)
+        magia, n, n_sim, n_cad = _CABECERA.unpack_from(mv, 0)
+        if magia != MAGIA:
+            raise ValueError(f"{path}: no es un árbol .llt")
+        self._mv = mv
+        pos = _CABECERA.size
+        self._sim_desp, self._sim_blob, pos = self._textos(pos, n_sim, False)
+        self._cad_desp, self._cad_blob, pos, self._etiquetas = self._textos(pos, n_cad, True)
+        self.fin, pos = self._arreglo(pos, "I", n)
+        self.lexema, pos = self._arreglo(pos, "i", n)
+        self.simbolo, pos = self._arreglo(pos, "H", n)
+        self._simbolos: Dict[int, str] = {}
+
+    def _arreglo(self, pos: int, tipo: str, n: int):
+        tam = array(tipo).itemsize * n
+        crudo = self._mv[pos:pos + tam]
+        if sys.byteorder == "little":
+            vista = crudo.cast(tipo)
+        else:
+            vista = array(tipo, crudo.tobytes()); vista.byteswap()
+        return vista, pos + tam + (-tam % 4)
+
+    def _textos(self, pos: int, n: int, con_etiquetas: bool):
+        desp, pos = self._arreglo(pos, "I", n + 1)
+        etiquetas = None
+        if con_etiquetas:
+            etiquetas = self._mv[pos:pos + n]
+            pos += n
+        fin_blob = pos + desp[n]
+        blob = self._mv[pos:fin_blob]
+        pos = fin_blob + (-fin_blob % 4)
+        return (desp, blob, pos, etiquetas) if con_etiquetas else (desp, blob, pos)
+
+    def __len__(self) -> int:
+        return len(self.simbolo)
+
+    @property
+    def raiz(self) -> NodoVista:
+        return NodoVista(self, 0)
+
+    def nodo(self, i: int) -> NodoVista:
+        return NodoVista(self, i)
+
+    def simbolo_de(self, i: int) -> str:
+        c = self.simbolo[i]
+        s = self._simbolos.get(c)
+        if s is None:
+            s = self._simbolos[c] = str(self._sim_blob[self._sim_desp[c]:self._sim_desp[c + 1]], "utf-8")
+        return s
+
+    def lexema_de(self, i: int):
+        k = self.lexema[i]
+        if k < 0:
+            return None
+        texto = str(self._cad_blob[self._cad_desp[k]:self._cad_desp[k + 1]], "utf-8")
+        return int(texto) if self._etiquetas[k] == _INT else texto
+
+    def hijos(self, i: int):
+        j, fin = i + 1, self.fin[i]
+        while j < fin:
+            yield j
+            j = self.fin[j]
+
+    def cerrar(self):
+        for v in (self.fin, self.lexema, self.simbolo, self._sim_desp, self._cad_desp,
+                  self._sim_blob, self._cad_blob, self._etiquetas, self._mv):
+            if isinstance(v, memoryview):
+                v.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+def abrir(path: str) -> ArbolBinario:
+    return ArbolBinario(path)
@@ -0,0 +1,66 @@
+"""Árbol binario .llt (arbol_binario.py) vs exportar DOT, sobre un árbol de ~1M nodos.
+
+Uso: python bench/bench_arbol_bin.py [--nodos N]
+"""
+import os, sys, time, random, tempfile, argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser_tree import parse_with_tree, to_dot
+from arbol_binario import guardar, abrir
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--nodos", type=int, default=1_000_000, help="Tamaño aproximado del árbol")
+    args = ap.parse_args()
+
+    with open(os.path.join(RAIZ, "tests", "ok", "009_pro_max.c"), encoding="utf-8") as f:
+        base = f.read()
+    fuente = base * max(1, args.nodos // 745)          # 009_pro_max.c tiene 745 nodos
+
+    with tempfile.TemporaryDirectory() as tmp:
+        llt, dot = os.path.join(tmp, "arbol.llt"), os.path.join(tmp, "arbol.dot")
+
+        t0 = time.perf_counter()
+        assert guardar(fuente, llt)
+        t_guardar = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        ok, raiz, _ = parse_with_tree(fuente, trazar_tabla=False)
+        t_arbol = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        with open(dot, "w", encoding="utf-8") as f:
+            f.write(to_dot(raiz))
+        t_dot = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        a = abrir(llt)
+        r = a.raiz
+        etiqueta = r.label
+        t_abrir = time.perf_counter() - t0
+
+        rnd = random.Random(3)
+        muestras = [rnd.randrange(len(a)) for _ in range(100_000)]
+        t0 = time.perf_counter()
+        for i in muestras:
+            n = a.nodo(i)
+            n.label; n.lexeme
+        t_azar = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        hojas = sum(1 for i in range(len(a)) if a.lexema[i] >= 0)
+        t_recorrer = time.perf_counter() - t0
+
+        print(f"Nodos: {len(a):,} (raíz {etiqueta}, {hojas:,} hojas con lexema)")
+        print(f"  .llt: {os.path.getsize(llt) / 1e6:8.2f} MB  parse+escribir {t_guardar:6.2f}s (sin Nodes)")
+        print(f"  .dot: {os.path.getsize(dot) / 1e6:8.2f} MB  parse_with_tree {t_arbol:6.2f}s + to_dot {t_dot:6.2f}s")
+        print(f"  abrir .llt y leer la raíz: {t_abrir * 1e3:.3f} ms")
+        print(f"  100k nodos al azar (label+lexema): {t_azar * 1e3:.1f} ms")
+        print(f"  recorrido lineal del arreglo de lexemas: {t_recorrer * 1e3:.1f} ms")
+        del r, n
+        a.cerrar()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Latencia de requests chicos mientras hay parses grandes en curso.
+
+Modos: bloqueante (parse síncrono dentro de la corrutina), cooperativo
+(parse_async cediendo cada N pasos) y executor (parse_async delegando los
+grandes a un hilo).
+
+Uso: python bench/bench_async.py [--grandes 4] [--repeticiones 300]
+"""
+import os, sys, glob, time, asyncio, argparse, contextlib, io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser import parse
+from ll1_async import parse_async
+
+def fuentes(repeticiones: int):
+    raiz = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "ok")
+    textos = [open(p, encoding="utf-8").read() for p in sorted(glob.glob(os.path.join(raiz, "*")))]
+    return "\n".join(textos * repeticiones), textos[0]
+
+async def correr(modo: str, grande: str, chico: str, n_grandes: int, n_chicos: int, intervalo: float):
+    async def pedido(src):
+        if modo == "bloqueante":
+            return parse(src, trazar=False)
+        umbral = 100_000 if modo == "executor" else None
+        return await parse_async(src, umbral_executor=umbral)
+
+    latencias = []
+
+    async def chico_en(t_llegada: float):
+        # latencia desde la llegada "programada": incluye el tiempo con el loop bloqueado
+        assert await pedido(chico)
+        latencias.append(time.perf_counter() - t_llegada)
+
+    t0 = time.perf_counter()
+    grandes = [asyncio.ensure_future(pedido(grande)) for _ in range(n_grandes)]
+    chicos = []
+    k = 0
+    while k < n_chicos:
+        await asyncio.sleep(max(t0 + k * intervalo - time.perf_counter(), 0))
+        ahora = time.perf_counter()
+        while k < n_chicos and t0 + k * intervalo <= ahora:   # todos los que ya "llegaron"
+            chicos.append(asyncio.ensure_future(chico_en(t0 + k * intervalo)))
+            k += 1
+    await asyncio.gather(*grandes, *chicos)
+    total = time.perf_counter() - t0
+    latencias.sort()
+    p = lambda q: latencias[min(len(latencias) - 1, int(q * len(latencias)))] * 1000
+    print(f"{modo:11s} chicos p50={p(0.50):8.2f}ms p99={p(0.99):8.2f}ms max={latencias[-1] * 1000:8.2f}ms  total={total:.2f}s")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--grandes", type=int, default=4)
+    ap.add_argument("--chicos", type=int, default=200)
+    ap.add_argument("--intervalo", type=float, default=0.005, help="segundos entre requests chicos")
+    ap.add_argument("--repeticiones", type=int, default=300)
+    args = ap.parse_args()
+    grande, chico = fuentes(args.repeticiones)
+    print(f"grande={len(grande)/1e6:.2f} MB x{args.grandes}, chicos={args.chicos}")
+    with contextlib.redirect_stderr(io.StringIO()):
+        for modo in ("bloqueante", "cooperativo", "executor"):
+            asyncio.run(correr(modo, grande, chico, args.grandes, args.chicos, args.intervalo))
+
+if __name__ == "__main__":
+    main()
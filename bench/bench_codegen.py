@@ -0,0 +1,80 @@
+"""Compara el driver interpretativo (ll1_parser.parse) con el parser generado.
+
+Uso: python bench/bench_codegen.py [--repeticiones N]
+"""
+import os, sys, glob, time, random, argparse, contextlib, io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser import parse, tabla_ll1, _tokenizar
+from ll1_codegen import cargar, parse_generado
+from gramaticas import obtener, disponibles
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def corpus(repeticiones: int):
+    raiz = os.path.join(RAIZ, "tests")
+    fuentes = []
+    for p in sorted(glob.glob(os.path.join(raiz, "ok", "*")) + glob.glob(os.path.join(raiz, "fail", "*"))):
+        with open(p, encoding="utf-8") as f:
+            fuentes.append(f.read())
+    return fuentes * repeticiones
+
+def verificar_equivalencia(mod, casos: int = 20000, semilla: int = 7, tabla=tabla_ll1):
+    """Secuencias aleatorias de terminales: ambos drivers deben coincidir."""
+    rnd = random.Random(semilla)
+    terminales = sorted({a for (_, a, _) in tabla} | {s for (_, _, p) in tabla for s in p} - {'vacia'}
+                        - {A for (A, _, _) in tabla})
+    for _ in range(casos):
+        t = [rnd.choice(terminales) for _ in range(rnd.randint(0, 12))] + ['eof']
+        assert mod.reconocer(t) == mod._reconocer_pila(t), t
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeticiones", type=int, default=200)
+    args = ap.parse_args()
+
+    mod = cargar()
+    verificar_equivalencia(mod)
+    for nombre in disponibles():
+        verificar_equivalencia(cargar(gramatica=nombre), 5000, tabla=obtener(nombre).tabla)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for p in glob.glob(os.path.join(RAIZ, "tests", "oraciones", "*", "*")):
+            src = open(p, encoding="utf-8").read()
+            assert parse_generado(src, "oracion_es") == parse(src, trazar=False, gramatica="oracion_es"), p
+    fuentes = corpus(args.repeticiones)
+
+    t0 = time.perf_counter()
+    tipos = [[t.type for t in _tokenizar(src)] for src in fuentes]
+    t_lex = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    esperado = [parse(src, trazar=False) for src in fuentes]
+    t_tabla = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    obtenido = [mod.reconocer(t) for t in tipos]
+    t_gen = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    completo = [parse_generado(src) for src in fuentes]
+    t_completo = time.perf_counter() - t0
+
+    assert esperado == obtenido == completo
+    n_tok = sum(len(t) for t in tipos)
+    print(f"archivos={len(fuentes)} tokens={n_tok}")
+    print(f"lexer                     : {t_lex:.3f}s")
+    print(f"driver tabla (lex+parse)  : {t_tabla:.3f}s  parse~{t_tabla - t_lex:.3f}s")
+    print(f"parser generado (parse)   : {t_gen:.3f}s  -> x{(t_tabla - t_lex) / t_gen:.1f} en la fase de parse")
+    print(f"parse_generado (lex+parse): {t_completo:.3f}s  -> x{t_tabla / t_completo:.1f} de punta a punta")
+
+    # Entrada chica: el costo fijo por llamada pesa más que el parse
+    chico, n = "int a = 1; a = a + 2;", 20000
+    for nombre, fn in (("parse", lambda: parse(chico, trazar=False)), ("parse_generado", lambda: parse_generado(chico))):
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn()
+        print(f"{nombre + ' (chica)':26s}: {(time.perf_counter() - t0) / n * 1e6:.1f} µs/llamada")
+
+if __name__ == "__main__":
+    main()
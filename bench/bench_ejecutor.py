@@ -0,0 +1,85 @@
+"""Ejecución de programas: código compilado (ejecutor.compilar) vs intérprete sobre el árbol.
+
+Uso: python bench/bench_ejecutor.py [--iteraciones N]
+"""
+import os, sys, time, argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ejecutor import _arbol, compilar, interpretar, ErrorEjecucion
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bucles anidados con aritmética entera, división C y condiciones compuestas
+BUCLES = """
+int i, j, s, c;
+s = 0; c = 0;
+for (i = 0; i < 300; i = i + 1) {
+    for (int j = 0; j < 300; j = j + 1) {
+        if ((i + j) / 2 * 2 == i + j && j != 0) { s = s + i * j / (j + 1); }
+        else { c = c + (2 * 3 - 4) * 8 / 4; }
+    }
+}
+"""
+
+# Casos chicos que solo se comparan (compilado == árbol): declaraciones que
+# no llegan a ejecutarse (o en ambas ramas de un if), asignaciones a un nombre
+# cuya DECL no corrió, un inicializador que lee al propio nombre y variables
+# numéricas que guardan cadenas.
+EQUIVALENCIA = [
+    "int a = 0; if (a) int b = 1;",
+    "int a = 1; if (a) int b = 1;",
+    "int a = 0; while (a) int c = 2;",
+    "int a = 1; { int a = a + 1; }",
+    "int i = 0; while (i < 3) { int x = x + 1; i = i + x; }",
+    "b = 5; int a = 0; if (a) int b = 1;",
+    "int a = 1; if (a) int b = 2; else int b = 3;",
+    "int a = 0; if (a) int b = 2; else int b = 3;",
+    "int a = 0; if (a) int b = 1; b = 5;",
+    "int a = 0; if (a) int b = 1; { b = 5; }",
+    "int b = 4; int a = 0; if (a) int b = 1;",
+    'int a = "3"; double d = a;',
+    'int a = "x"; double d = a;',
+    "int a = 2; double d = a; int e = d * 3 / 4;",
+]
+
+def medir(fn):
+    t0 = time.perf_counter()
+    try:
+        r = fn()
+    except ErrorEjecucion as e:
+        r = f"[EJEC] {e}"
+    return r, time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--iteraciones", type=int, default=200_000,
+                    help="Tope de vueltas (009_pro_max.c no termina: se corre hasta el tope)")
+    args = ap.parse_args()
+
+    carpeta = os.path.join(RAIZ, "tests", "ok")
+    corpus = []
+    for nombre in sorted(os.listdir(carpeta)):
+        with open(os.path.join(carpeta, nombre), encoding="utf-8") as f:
+            corpus.append(f.read())
+    for fuente in EQUIVALENCIA + corpus:
+        raiz = _arbol(fuente)
+        r_comp, _ = medir(lambda: compilar(raiz).ejecutar(args.iteraciones))
+        r_arbol, _ = medir(lambda: interpretar(raiz, args.iteraciones))
+        assert r_comp == r_arbol, (fuente[:60], r_comp, r_arbol)
+    print(f"equivalencia compilado/árbol: {len(EQUIVALENCIA) + len(corpus)} programas")
+
+    with open(os.path.join(carpeta, "009_pro_max.c"), encoding="utf-8") as f:
+        pro_max = f.read()
+
+    print(f"{'programa':16s} {'compilar ms':>11s} {'compilado ms':>12s} {'árbol ms':>10s} {'speedup':>8s}")
+    for nombre, fuente in (("009_pro_max.c", pro_max), ("bucles 300x300", BUCLES)):
+        raiz = _arbol(fuente)
+        prog, t_comp = medir(lambda: compilar(raiz))
+        r_comp, t_run = medir(lambda: prog.ejecutar(args.iteraciones))
+        r_arbol, t_arbol = medir(lambda: interpretar(raiz, args.iteraciones))
+        assert r_comp == r_arbol, (r_comp, r_arbol)
+        print(f"{nombre:16s} {t_comp * 1e3:11.2f} {t_run * 1e3:12.1f} {t_arbol * 1e3:10.1f} {t_arbol / t_run:7.1f}x")
+
+if __name__ == "__main__":
+    main()
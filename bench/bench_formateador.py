@@ -0,0 +1,79 @@
+"""Throughput (MB/s) y memoria del formateador en streaming sobre un archivo grande.
+
+Uso: python bench/bench_formateador.py [--mb N]
+"""
+import io, os, sys, time, tempfile, argparse, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from formateador import formatear, misma_secuencia
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mb", type=float, default=5.0, help="Tamaño aproximado de la entrada")
+    args = ap.parse_args()
+
+    with open(os.path.join(RAIZ, "tests", "ok", "009_pro_max.c"), encoding="utf-8") as f:
+        base = f.read()
+    copias = max(1, int(args.mb * 1e6 / len(base)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        entrada, salida = os.path.join(tmp, "in.c"), os.path.join(tmp, "out.c")
+        with open(entrada, "w", encoding="utf-8") as f:
+            for _ in range(copias):
+                f.write(base)
+        tam = os.path.getsize(entrada)
+
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        with open(entrada, "rb") as fi, open(salida, "w", encoding="utf-8") as fo:
+            assert formatear(fi, fo)
+        t = time.perf_counter() - t0
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # segunda medición sin tracemalloc (que encarece cada asignación)
+        t0 = time.perf_counter()
+        with open(entrada, "rb") as fi, open(salida, "w", encoding="utf-8") as fo:
+            assert formatear(fi, fo)
+        t = min(t, time.perf_counter() - t0)
+
+        with open(entrada, encoding="utf-8") as f1, open(salida, encoding="utf-8") as f2:
+            original, formateado = f1.read(), f2.read()
+        assert misma_secuencia(original, formateado)
+        with open(salida, "rb") as fi, open(os.path.join(tmp, "out2.c"), "w", encoding="utf-8") as fo:
+            assert formatear(fi, fo)
+        with open(os.path.join(tmp, "out2.c"), encoding="utf-8") as f:
+            assert f.read() == formateado          # idempotente
+
+    print(f"Entrada: {tam / 1e6:.2f} MB -> salida {len(formateado) / 1e6:.2f} MB")
+    print(f"  {t:.2f}s  ({tam / 1e6 / t:.2f} MB/s)  pico de memoria {pico / 1e3:.0f} KB")
+    print("  ida y vuelta: misma secuencia de tokens; formatear la salida no la cambia")
+
+    # Memoria acotada también sin espacios: el pico no crece con el tamaño
+    (chico, tam_chico), (grande, tam_grande) = pico_sin_espacios(5_000), pico_sin_espacios(40_000)
+    assert grande < 2 * chico, (chico, grande)
+    print(f"Sin espacios: pico {chico / 1e3:.0f} KB con {tam_chico / 1e6:.2f} MB, "
+          f"{grande / 1e3:.0f} KB con {tam_grande / 1e6:.2f} MB")
+
+# Sin un solo espacio: antes del corte en ';' '{' '}' ... ParserIncremental
+# retenía todo el archivo hasta close() y la memoria crecía con la entrada.
+SIN_ESPACIOS = "a=1;b=a*2;if(a<b){a=a+1;}else{b=b-1;}while(a<3){a=a+(b-1)/2;}"
+
+def pico_sin_espacios(copias: int):
+    """Pico de memoria (bytes) al formatear SIN_ESPACIOS * copias, y el tamaño de la entrada."""
+    entrada = io.BytesIO((SIN_ESPACIOS * copias).encode("utf-8"))
+    tracemalloc.start()
+    assert formatear(entrada, _Descarte())
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pico, len(entrada.getvalue())
+
+class _Descarte(io.StringIO):
+    def write(self, s):
+        return len(s)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Árboles de un lote con sentencias repetidas: parse_with_tree normal vs con Internador.
+
+Uso: python bench/bench_internado.py [--copias N]
+"""
+import os, sys, glob, time, random, argparse, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser_tree import parse_with_tree
+from internado import Internador, parse_lote, contar_nodos
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def corpus(copias: int):
+    """Corpus "generado": cada archivo mezcla sentencias del corpus ok/ en distinto orden."""
+    lineas = []
+    for p in sorted(glob.glob(os.path.join(RAIZ, "tests", "ok", "*.c"))):
+        with open(p, encoding="utf-8") as f:
+            lineas.append(f.read())
+    rnd = random.Random(5)
+    return ["\n".join(rnd.sample(lineas, len(lineas))) for _ in range(copias)]
+
+def medir(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    r = fn()
+    t = time.perf_counter() - t0
+    retenido = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return r, t, retenido
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--copias", type=int, default=100)
+    args = ap.parse_args()
+    fuentes = corpus(args.copias)
+
+    normal, t_n, mem_n = medir(lambda: [parse_with_tree(s, trazar_tabla=False)[:2] for s in fuentes])
+    internador = Internador()
+    compartido, t_i, mem_i = medir(lambda: parse_lote(fuentes, internador))
+
+    for (ok_a, a), (ok_b, b) in zip(normal[:5], compartido[:5]):   # igualdad estructural (muestra)
+        assert ok_a == ok_b and a == b
+
+    total = sum(contar_nodos(r)[0] for _, r in normal)
+    print(f"Archivos: {len(fuentes)}  nodos de árbol: {total:,}")
+    print(f"  normal:     {t_n:6.2f}s  {mem_n / 1e6:8.1f} MB retenidos")
+    print(f"  internado:  {t_i:6.2f}s  {mem_i / 1e6:8.1f} MB retenidos  "
+          f"({internador.unicos:,} nodos únicos, {len(internador.memo)} sentencias en memo)")
+    print(f"  ahorro: memoria {1 - mem_i / mem_n:.0%}, tiempo {1 - t_i / t_n:.0%}")
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(100_000)
+    main()
@@ -0,0 +1,42 @@
+"""Micro-benchmark del lexer: entrada con muchos identificadores y entrada con basura.
+
+Uso: python bench/bench_lexer.py [--lineas N]
+"""
+import os, sys, time, random, argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from c_lexer import lexer, reiniciar
+
+def identificadores(lineas: int, semilla: int = 3) -> str:
+    rnd = random.Random(semilla)
+    nombres = ["integer", "format", "iffy", "elsewhere", "whiley", "doubled", "charset",
+               "x", "contador_total", "tmp1", "forma", "intento"]
+    out = []
+    for _ in range(lineas):
+        a, b, c = (rnd.choice(nombres) for _ in range(3))
+        out.append(f"{a} = {b} + {c} * {a};")
+    return "\n".join(out)
+
+def basura(lineas: int) -> str:
+    return "\n".join("El niño comió más pan. ¿Qué pasó? ~~~ @@@ ###" for _ in range(lineas))
+
+def medir(nombre: str, src: str, max_errores=None):
+    lexer.max_errores = max_errores
+    t0 = time.perf_counter()
+    reiniciar(lexer, src)
+    n = sum(1 for _ in iter(lexer.token, None))
+    dt = time.perf_counter() - t0
+    print(f"{nombre:28s} {len(src) / 1e6:6.2f} MB  tokens={n:8d}  errores={len(lexer.errores):6d}  "
+          f"{dt:.3f}s  {n / dt / 1e6:.2f} Mtok/s")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lineas", type=int, default=50_000)
+    args = ap.parse_args()
+    medir("identificadores", identificadores(args.lineas))
+    medir("basura (sin presupuesto)", basura(args.lineas))
+    medir("basura (max_errores=100)", basura(args.lineas), max_errores=100)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Entradas adversarias contra parse(..., limites=...) y costo de los chequeos.
+
+Verifica (sale con código 1 si falla) que cada entrada corta con el
+límite esperado; los tiempos solo se informan. El sobrecosto se mide
+alternando con y sin topes y se reporta la mediana y el rango.
+
+Uso: python bench/bench_limites.py [--rondas N]
+"""
+import os, sys, time, argparse, statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser import parse
+from limites import Limites, LimiteExcedido
+from gramaticas import obtener
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+fallas = []
+
+def medir(fn):
+    t0 = time.perf_counter()
+    r = fn()
+    return r, time.perf_counter() - t0
+
+def caso(nombre, codigo, limites, esperado):
+    r, t = medir(lambda: parse(codigo, trazar=False, limites=limites))
+    bien = isinstance(r, LimiteExcedido) and r.limite == esperado
+    if not bien:
+        fallas.append(f"{nombre}: se esperaba LimiteExcedido({esperado!r}), se obtuvo {r!r}")
+    print(f"  {'ok ' if bien else 'MAL'} {nombre:38s} -> {r}  en {t * 1e3:8.1f} ms")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rondas", type=int, default=15, help="Rondas alternadas para medir el sobrecosto")
+    args = ap.parse_args()
+
+    with open(os.path.join(RAIZ, "tests", "ok", "009_pro_max.c"), encoding="utf-8") as f:
+        base = f.read()
+
+    print("Entradas adversarias:")
+    n = 50_000
+    caso("paréntesis anidados (50k)", "a = " + "(" * n + "1" + ")" * n + ";",
+         Limites(max_pila=10_000), "max_pila")
+    caso("archivo enorme (20 MB)", base * (20_000_000 // len(base)),
+         Limites(max_bytes=1_000_000), "max_bytes")
+    caso("muchos tokens (1M sentencias)", "a = 1;" * 1_000_000,
+         Limites(max_tokens=100_000), "max_tokens")
+    caso("programa largo y válido", base * 500,
+         Limites(max_pasos=200_000), "max_pasos")
+    lx = obtener().lexer
+    max_errores, lx.max_errores = lx.max_errores, None     # sin el tope propio del lexer
+    try:
+        caso("caracteres ilegales sin fin (plazo 0.2s)", "@a" * 3_000_000,
+             Limites(plazo=0.2), "plazo")
+    finally:
+        lx.max_errores = max_errores
+    caso("'/*' sin cerrar repetido (plazo 0.2s)", "/*a" * 80_000,
+         Limites(plazo=0.2), "plazo")
+    caso("anidamiento profundo (plazo 0.2s)", "a = " + "(" * 400_000 + "1" + ")" * 400_000 + ";",
+         Limites(plazo=0.2), "plazo")
+
+    try:
+        Limites(max_tokens=10, cada=0)
+        fallas.append("Limites(cada=0) no fue rechazado")
+    except ValueError:
+        pass
+    if parse("a = 1;", trazar=False, limites=Limites(max_tokens=10, max_pila=100, max_pasos=100, plazo=1)) is not True:
+        fallas.append("una entrada chica dentro de los topes no fue aceptada")
+
+    # Costo de los chequeos con topes holgados que nunca se alcanzan: rondas
+    # alternadas (con/sin) para que el ruido del sistema afecte a ambas por igual
+    fuente = base * 300
+    holgados = Limites(max_bytes=1 << 30, max_tokens=1 << 30, max_pila=1 << 30, max_pasos=1 << 40, plazo=3600)
+    if parse(fuente, trazar=False, limites=holgados) is not True:
+        fallas.append("la entrada válida con topes holgados no fue aceptada")
+    sin, con = [], []
+    for _ in range(args.rondas):
+        sin.append(medir(lambda: parse(fuente, trazar=False))[1])
+        con.append(medir(lambda: parse(fuente, trazar=False, limites=holgados))[1])
+    relativo = sorted(c / s - 1 for s, c in zip(sin, con))
+    print(f"\nSobrecosto de los chequeos ({len(fuente) / 1e6:.1f} MB válidos, {args.rondas} rondas): "
+          f"mediana {statistics.median(relativo):+.1%}, rango {relativo[0]:+.1%} .. {relativo[-1]:+.1%} "
+          f"(mejor sin {min(sin) * 1e3:.0f} ms, mejor con {min(con) * 1e3:.0f} ms: {min(con) / min(sin) - 1:+.1%})")
+
+    if fallas:
+        print("\nFALLAS:")
+        for f in fallas:
+            print(f"  {f}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
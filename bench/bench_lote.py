@@ -0,0 +1,55 @@
+"""Throughput de validar_lote (con y sin pre-filtro NumPy) frente a parse por archivo.
+
+Uso: python bench/bench_lote.py [--repeticiones N]
+"""
+import os, sys, glob, time, argparse, contextlib, io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser import parse
+from ll1_codegen import cargar
+from validacion_lote import validar_lote, _tipos
+
+def corpus(repeticiones: int):
+    raiz = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+    fuentes = []
+    for p in sorted(glob.glob(os.path.join(raiz, "ok", "*")) + glob.glob(os.path.join(raiz, "fail", "*"))):
+        with open(p, encoding="utf-8") as f:
+            fuentes.append(f.read())
+    return fuentes * repeticiones
+
+def mejor(fn, rondas):
+    tiempos = []
+    for _ in range(rondas):
+        t0 = time.perf_counter()
+        r = fn()
+        tiempos.append(time.perf_counter() - t0)
+    return r, min(tiempos)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeticiones", type=int, default=200)
+    ap.add_argument("--rondas", type=int, default=5)
+    args = ap.parse_args()
+    fuentes = corpus(args.repeticiones)
+    mb = sum(len(s.encode("utf-8")) for s in fuentes) / 1e6
+
+    reconocer = cargar().reconocer
+    with contextlib.redirect_stdout(io.StringIO()):   # el lexer reporta caracteres ilegales
+        # mejor de --rondas (el sistema es ruidoso y las corridas son de décimas de segundo)
+        base, t_base = mejor(lambda: [parse(src, trazar=False) for src in fuentes], args.rondas)
+        sin_filtro, t_sin = mejor(lambda: [ts is not None and reconocer(ts) for ts in map(_tipos, fuentes)],
+                                  args.rondas)
+        (veredictos, _), t_lote = mejor(lambda: validar_lote(fuentes), args.rondas)
+        (filtrados, stats), t_filtro = mejor(lambda: validar_lote(fuentes, prefiltro=True), args.rondas)
+
+    assert veredictos == filtrados == base == sin_filtro
+    print(f"archivos={stats['total']} ({mb:.2f} MB), decididos por el filtro={stats['decididos_por_filtro']}")
+    print(f"parse por archivo       : {t_base:.3f}s  {mb / t_base:.2f} MB/s")
+    print(f"lex + generado          : {t_sin:.3f}s  {mb / t_sin:.2f} MB/s")
+    print(f"validar_lote            : {t_lote:.3f}s  {mb / t_lote:.2f} MB/s  (x{t_base / t_lote:.2f})")
+    print(f"validar_lote(prefiltro) : {t_filtro:.3f}s  {mb / t_filtro:.2f} MB/s  "
+          f"({t_lote / t_filtro - 1:+.1%} frente a sin filtro)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""ParserIncremental: equivalencia con parse() por fragmentos al azar y texto pendiente.
+
+Uso: python bench/bench_push.py [--semillas N]
+"""
+import os, sys, glob, time, random, argparse, contextlib, io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser import parse
+from ll1_push import ParserIncremental
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def corpus():
+    """(nombre, bytes, gramática): tests/{ok,fail,mixed} con c_subset y tests/oraciones con oracion_es."""
+    out = []
+    for patron, gramatica in (("*", "c_subset"), (os.path.join("oraciones", "*"), "oracion_es")):
+        for p in sorted(glob.glob(os.path.join(RAIZ, "tests", patron, "*"))):
+            if os.path.isfile(p) and os.path.basename(os.path.dirname(p)) in ("ok", "fail", "mixed"):
+                with open(p, "rb") as f:
+                    out.append((os.path.relpath(p, RAIZ), f.read(), gramatica))
+    return out
+
+def por_fragmentos(datos: bytes, rnd: random.Random, gramatica: str, minimo=1, maximo=7):
+    """Alimenta `datos` en pedazos de minimo..maximo bytes (corta secuencias UTF-8)."""
+    p = ParserIncremental(gramatica=gramatica)
+    i = 0
+    while i < len(datos):
+        k = rnd.randint(minimo, maximo)
+        p.feed(datos[i:i + k])
+        i += k
+    p.close()
+    return p
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--semillas", type=int, default=20, help="Particiones al azar por archivo")
+    args = ap.parse_args()
+
+    # 1) Veredicto y sentencias iguales a parse()/entrada completa, para cualquier partición
+    casos = corpus()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for nombre, datos, gramatica in casos:
+            esperado = bool(parse(datos.decode("utf-8", errors="replace"), trazar=False, gramatica=gramatica))
+            entero = ParserIncremental(gramatica=gramatica); entero.feed(datos); entero.close()
+            stmts = [e for e in entero.eventos if e["type"] == "stmt"]
+            assert entero.ok == esperado, nombre
+            for semilla in range(args.semillas):
+                p = por_fragmentos(datos, random.Random(semilla), gramatica)
+                assert p.ok == esperado, (nombre, semilla)
+                assert [e for e in p.eventos if e["type"] == "stmt"] == stmts, (nombre, semilla)
+    print(f"equivalencia con parse(): {len(casos)} archivos x {args.semillas} particiones de 1-7 bytes")
+
+    # 2) Entrada sin espacios: se corta en cada ';' y lo pendiente queda acotado
+    datos = b"a=1;" * 80_000
+    p = ParserIncremental()
+    en_feed, pendiente_max = 0, 0
+    t0 = time.perf_counter()
+    for i in range(0, len(datos), 509):
+        en_feed += sum(1 for e in p.feed(datos[i:i + 509]) if e["type"] == "stmt")
+        pendiente_max = max(pendiente_max, p.pendiente)
+    en_close = sum(1 for e in p.close() if e["type"] == "stmt")
+    t = time.perf_counter() - t0
+    assert p.ok and en_feed + en_close == 80_000 and pendiente_max < 509
+    print(f"sin espacios ({len(datos) / 1e3:.0f} KB en pedazos de 509): {en_feed} sentencias en feed(), "
+          f"{en_close} en close(), pendiente máx {pendiente_max} caracteres, {len(datos) / t / 1e6:.2f} MB/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""referencias.indexar: ocurrencias esperadas, costo del índice y latencia de consultas.
+
+Verifica (sale con código 1 si falla) roles, líneas, columnas 1-based e
+índices de token en casos chicos; que en tests/ok cada identificador
+tenga exactamente una ocurrencia y su columna apunte al lexema; que
+ParserIncremental arme el mismo índice y que guardar/cargar lo conserve.
+El sobrecosto se mide alternando parse() sin oyente y con el índice y
+se reporta la mediana y el rango; las consultas, el mejor promedio.
+
+Uso: python bench/bench_referencias.py [--rondas N] [--copias N]
+"""
+import os, sys, glob, time, argparse, statistics, tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser import parse, _tokenizar
+from ll1_push import ParserIncremental
+from referencias import IndiceReferencias, indexar
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (nombre, código, {identificador: [(token, línea, columna, rol), ...]})
+CASOS = [
+    ("columna 1 al inicio del archivo", "int a;\na = 1;",
+     {"a": [(1, 1, 5, "decl"), (3, 2, 1, "asig")]}),
+    ("decl, asig y uso con sangría", "int a = 1;\n  a = a + 2;",
+     {"a": [(1, 1, 5, "decl"), (5, 2, 3, "asig"), (7, 2, 7, "uso")]}),
+    ("decl múltiple", "int a, b = a;",
+     {"a": [(1, 1, 5, "decl"), (5, 1, 12, "uso")], "b": [(3, 1, 8, "decl")]}),
+    ("for: init, condición y post", "for (int i = 0; i < 3; i = i + 1) { }",
+     {"i": [(3, 1, 10, "decl"), (7, 1, 17, "uso"), (11, 1, 24, "asig"), (13, 1, 28, "uso")]}),
+    ("mismo lexema en ámbitos distintos", "int x;\n{\n\tint x = x;\n}",
+     {"x": [(1, 1, 5, "decl"), (5, 3, 6, "decl"), (7, 3, 10, "uso")]}),
+]
+
+fallas = []
+
+def tuplas(idx):
+    return {n: [(o.token, o.linea, o.columna, o.rol) for o in idx.ocurrencias(n)] for n in idx.nombres()}
+
+def push(codigo):
+    idx = IndiceReferencias(codigo)
+    p = ParserIncremental(oyente=idx)
+    for i in range(0, len(codigo), 5):
+        p.feed(codigo[i:i + 5])
+    p.close()
+    return p.ok, idx
+
+def verificar():
+    print("Casos:")
+    for nombre, codigo, esperado in CASOS:
+        ok, idx = indexar(codigo)
+        bien = ok is True and tuplas(idx) == esperado
+        if not bien:
+            fallas.append(f"{nombre}: se esperaba {esperado!r}, se obtuvo ok={ok} {tuplas(idx)!r}")
+        print(f"  {'ok ' if bien else 'MAL'} {nombre}")
+
+    for p in sorted(glob.glob(os.path.join(RAIZ, "tests", "ok", "*"))):
+        base = os.path.basename(p)
+        with open(p, encoding="utf-8") as f:
+            codigo = f.read()
+        ok, idx = indexar(codigo)
+        ids = [t.value for t in _tokenizar(codigo) if t.type == "identificador"]
+        if len(idx) != len(ids) or sorted(idx.nombres()) != sorted(set(ids)):
+            fallas.append(f"{base}: {len(idx)} ocurrencias para {len(ids)} identificadores")
+        lineas = codigo.split("\n")
+        for n in idx.nombres():
+            for o in idx.ocurrencias(n):
+                if not lineas[o.linea - 1].startswith(n, o.columna - 1):
+                    fallas.append(f"{base}: '{n}' en línea {o.linea}, columna {o.columna} no apunta al lexema")
+        if push(codigo)[1].a_dict() != idx.a_dict():
+            fallas.append(f"{base}: ParserIncremental arma otro índice")
+        with tempfile.TemporaryDirectory() as d:
+            ruta = os.path.join(d, "refs.json")
+            idx.guardar(ruta)
+            if tuplas(IndiceReferencias.cargar(ruta)) != tuplas(idx):
+                fallas.append(f"{base}: guardar/cargar no conserva el índice")
+
+def medir(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rondas", type=int, default=15, help="Rondas alternadas para medir el sobrecosto")
+    ap.add_argument("--copias", type=int, default=50, help="Copias de 009_pro_max.c en la entrada medida")
+    args = ap.parse_args()
+
+    verificar()
+
+    # Rondas alternadas (sin/con) para que el ruido del sistema afecte a ambas por igual
+    with open(os.path.join(RAIZ, "tests", "ok", "009_pro_max.c"), encoding="utf-8") as f:
+        fuente = f.read() * args.copias
+    sin, con = [], []
+    for _ in range(args.rondas):
+        sin.append(medir(lambda: parse(fuente, trazar=False)))
+        con.append(medir(lambda: parse(fuente, trazar=False, oyente=IndiceReferencias(fuente))))
+    relativo = sorted(c / s - 1 for s, c in zip(sin, con))
+    print(f"\nSobrecosto de IndiceReferencias (009_pro_max x{args.copias}, {args.rondas} rondas): "
+          f"mediana {statistics.median(relativo):+.1%}, rango {relativo[0]:+.1%} .. {relativo[-1]:+.1%} "
+          f"(mejor sin {min(sin) * 1e3:.1f} ms, mejor con {min(con) * 1e3:.1f} ms: {min(con) / min(sin) - 1:+.1%})")
+
+    _, idx = indexar(fuente)
+    n = 2000
+    for consulta in ("declaraciones", "asignaciones", "usos"):
+        fn = getattr(idx, consulta)
+        hits = len(fn("i"))
+        t = min(medir(lambda: [fn("i") for _ in range(n)]) for _ in range(args.rondas)) / n
+        print(f"{consulta + '(' + repr('i') + ')':22s}: {hits:4d} ocurrencias en {t * 1e6:6.1f} µs")
+    print(f"ocurrencias indexadas: {len(idx)}")
+
+    if fallas:
+        print("\nFALLAS:")
+        for f in fallas:
+            print(f"  {f}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
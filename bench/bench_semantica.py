@@ -0,0 +1,104 @@
+"""semantica.comprobar: diagnósticos esperados y costo del oyente en parse().
+
+Verifica (sale con código 1 si falla) no declarados, redeclarados y
+ámbitos de bloques y de `for`, y que ParserIncremental con el mismo
+oyente dé lo mismo. El sobrecosto se mide alternando parse() sin oyente
+y con ComprobadorDeclaraciones y se reporta la mediana y el rango.
+
+Uso: python bench/bench_semantica.py [--rondas N] [--copias N]
+"""
+import os, sys, glob, time, argparse, statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser import parse
+from ll1_push import ParserIncremental
+from semantica import comprobar, ComprobadorDeclaraciones
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (nombre, código, diagnósticos esperados)
+CASOS = [
+    ("declarado y usado", "int a; a = 1; int b = a + 2;", []),
+    ("asignado sin declarar", "a = 1;",
+     ["[SEM] línea 1: 'a' asignado sin declarar"]),
+    ("usado sin declarar", "int a = b;",
+     ["[SEM] línea 1: 'b' usado sin declarar"]),
+    ("redeclarado en el mismo ámbito", "int a;\nint a;",
+     ["[SEM] línea 2: 'a' redeclarado en el mismo ámbito"]),
+    ("decl múltiple repetida", "int a, a;",
+     ["[SEM] línea 1: 'a' redeclarado en el mismo ámbito"]),
+    ("sombra en un bloque interno", "int a; { int a; a = 2; } a = 3;", []),
+    ("el bloque cierra su ámbito", "{ int a; }\na = 1;",
+     ["[SEM] línea 2: 'a' asignado sin declarar"]),
+    ("variable del for visible en el cuerpo", "for (int i = 0; i < 3; i = i + 1) { i = i; }", []),
+    ("variable del for sin llaves", "int s = 0; for (int i = 0; i < 3; i = i + 1) s = s + i;", []),
+    ("variable del for fuera del for", "for (int i = 0; i < 3; i = i + 1) { }\ni = 1;",
+     ["[SEM] línea 2: 'i' asignado sin declarar"]),
+    ("for sin llaves cierra su ámbito", "int s;\nfor (int i = 0; i < 3; i = i + 1) s = i;\ns = i;",
+     ["[SEM] línea 3: 'i' usado sin declarar"]),
+    ("for redeclara una global", "int i; for (int i = 0; i < 1; i = i + 1) { }", []),
+    ("fors consecutivos", "for (int i = 0; i < 1; i = i + 1) { } for (int i = 0; i < 1; i = i + 1) { }", []),
+    ("for anidados", "for (int i = 0; i < 2; i = i + 1) for (int j = 0; j < i; j = j + 1) { int k = i + j; }\nk = 1;",
+     ["[SEM] línea 2: 'k' asignado sin declarar"]),
+]
+
+fallas = []
+
+def push(codigo):
+    comp = ComprobadorDeclaraciones()
+    p = ParserIncremental(oyente=comp)
+    p.feed(codigo)
+    p.close()
+    return p.ok, comp.diagnosticos
+
+def verificar():
+    print("Casos:")
+    for nombre, codigo, esperado in CASOS:
+        ok, diags = comprobar(codigo)
+        bien = ok is True and diags == esperado
+        if not bien:
+            fallas.append(f"{nombre}: se esperaba {esperado!r}, se obtuvo ok={ok} {diags!r}")
+        if push(codigo) != (ok, diags):
+            fallas.append(f"{nombre}: ParserIncremental con el oyente no coincide con parse()")
+        print(f"  {'ok ' if bien else 'MAL'} {nombre}")
+    # Corpus: el veredicto sintáctico no cambia con el oyente
+    for p in sorted(glob.glob(os.path.join(RAIZ, "tests", "ok", "*"))):
+        with open(p, encoding="utf-8") as f:
+            codigo = f.read()
+        if comprobar(codigo)[0] is not parse(codigo, trazar=False):
+            fallas.append(f"{os.path.basename(p)}: el oyente cambia el veredicto")
+
+def medir(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rondas", type=int, default=15, help="Rondas alternadas para medir el sobrecosto")
+    ap.add_argument("--copias", type=int, default=50, help="Copias de 009_pro_max.c en la entrada medida")
+    args = ap.parse_args()
+
+    verificar()
+
+    # Rondas alternadas (sin/con) para que el ruido del sistema afecte a ambas por igual
+    with open(os.path.join(RAIZ, "tests", "ok", "009_pro_max.c"), encoding="utf-8") as f:
+        fuente = f.read() * args.copias
+    sin, con = [], []
+    for _ in range(args.rondas):
+        sin.append(medir(lambda: parse(fuente, trazar=False)))
+        con.append(medir(lambda: parse(fuente, trazar=False, oyente=ComprobadorDeclaraciones())))
+    relativo = sorted(c / s - 1 for s, c in zip(sin, con))
+    print(f"\nSobrecosto de ComprobadorDeclaraciones (009_pro_max x{args.copias}, {args.rondas} rondas): "
+          f"mediana {statistics.median(relativo):+.1%}, rango {relativo[0]:+.1%} .. {relativo[-1]:+.1%} "
+          f"(mejor sin {min(sin) * 1e3:.1f} ms, mejor con {min(con) * 1e3:.1f} ms: {min(con) / min(sin) - 1:+.1%})")
+
+    if fallas:
+        print("\nFALLAS:")
+        for f in fallas:
+            print(f"  {f}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Memoria y velocidad de búsqueda: índice dict (_indice) vs TablaCompacta.
+
+Uso: python bench/bench_tabla.py
+"""
+import os, sys, time, random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser import _indice
+from tabla_compacta import compactar
+
+def tam_profundo(obj, vistos=None) -> int:
+    """sys.getsizeof recursivo contando cada objeto una sola vez."""
+    vistos = set() if vistos is None else vistos
+    if id(obj) in vistos:
+        return 0
+    vistos.add(id(obj))
+    n = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        n += sum(tam_profundo(k, vistos) + tam_profundo(v, vistos) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        n += sum(tam_profundo(x, vistos) for x in obj)
+    elif hasattr(obj, "__dict__"):
+        n += tam_profundo(vars(obj), vistos)
+    return n
+
+def main():
+    tc = compactar()
+    nts, ts = tc.no_terminales, tc.terminales
+    # verificación exhaustiva sobre la matriz completa
+    for A in nts:
+        for a in ts:
+            p = _indice.get((A, a))
+            esperado = None if p is None else tuple(s for s in p if s != 'vacia')
+            assert tc.buscar(A, a) == esperado, (A, a)
+
+    celdas = len(nts) * len(ts)
+    print(f"matriz {len(nts)}x{len(ts)} = {celdas} celdas, {len(_indice)} no vacías "
+          f"({100 * len(_indice) / celdas:.0f}%)")
+    print(f"filas únicas tras deduplicar: {tc.filas_unicas}/{len(nts)}, "
+          f"arreglo empaquetado: {len(tc.check)} posiciones, producciones internadas: {len(tc.producciones)}")
+    print(f"memoria dict _indice   : {tam_profundo(_indice):7d} B")
+    print(f"memoria TablaCompacta  : {tam_profundo(tc):7d} B")
+
+    rnd = random.Random(0)
+    pares = [(rnd.choice(nts), rnd.choice(ts)) for _ in range(200_000)]
+    pares_c = [(tc.cod_nt[A], tc.cod_t[a]) for A, a in pares]
+
+    t0 = time.perf_counter()
+    for A, a in pares:
+        _indice.get((A, a))
+    t_dict = time.perf_counter() - t0
+
+    buscar = tc.buscar
+    t0 = time.perf_counter()
+    for A, a in pares:
+        buscar(A, a)
+    t_nom = time.perf_counter() - t0
+
+    buscar_codigos = tc.buscar_codigos
+    t0 = time.perf_counter()
+    for nt, t in pares_c:
+        buscar_codigos(nt, t)
+    t_cod = time.perf_counter() - t0
+
+    n = len(pares)
+    print(f"búsqueda dict (A,a)          : {t_dict / n * 1e9:6.1f} ns")
+    print(f"búsqueda compacta (nombres)  : {t_nom / n * 1e9:6.1f} ns")
+    print(f"búsqueda compacta (códigos)  : {t_cod / n * 1e9:6.1f} ns")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Costo por nodo de visitante.Visitante vs recursión escrita a mano y vs getattr por nodo.
+
+Uso: python bench/bench_visitante.py [--copias N]
+"""
+import os, sys, time, argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ll1_parser_tree import parse_with_tree
+from visitante import Visitante
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Misma tarea en las tres variantes: identificadores usados, DECLs y anidamiento máximo de bloques
+class Conteo(Visitante):
+    def __init__(self):
+        self.usos = self.decls = self.prof = self.maxima = 0
+
+    def visit_PRIMARY(self, n):
+        if n.children[0].label == 'identificador':
+            self.usos += 1
+
+    def visit_DECL(self, n):
+        self.decls += 1
+
+    def visit_BLOCK(self, n):
+        self.prof += 1
+        self.maxima = max(self.maxima, self.prof)
+
+    def leave_BLOCK(self, n):
+        self.prof -= 1
+
+def a_mano(raiz):
+    r = {"usos": 0, "decls": 0, "prof": 0, "maxima": 0}
+    def rec(n):
+        if n.label == 'PRIMARY':
+            if n.children[0].label == 'identificador':
+                r["usos"] += 1
+        elif n.label == 'DECL':
+            r["decls"] += 1
+        elif n.label == 'BLOCK':
+            r["prof"] += 1
+            r["maxima"] = max(r["maxima"], r["prof"])
+        for c in n.children:
+            rec(c)
+        if n.label == 'BLOCK':
+            r["prof"] -= 1
+    rec(raiz)
+    return r["usos"], r["decls"], r["maxima"]
+
+class PorGetattr:
+    """El visitante "clásico": arma el nombre del método y hace getattr en cada nodo."""
+    def __init__(self):
+        self.c = Conteo()
+
+    def recorrer(self, n):
+        f = getattr(self.c, "visit_" + n.label, None)
+        if f is not None:
+            f(n)
+        for c in n.children:
+            self.recorrer(c)
+        f = getattr(self.c, "leave_" + n.label, None)
+        if f is not None:
+            f(n)
+
+def contar(n):
+    total, pila = 0, [n]
+    while pila:
+        x = pila.pop(); total += 1; pila.extend(x.children)
+    return total
+
+def medir(fn, repeticiones=3):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        r = fn()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return r, mejor
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--copias", type=int, default=200)
+    args = ap.parse_args()
+    with open(os.path.join(RAIZ, "tests", "ok", "009_pro_max.c"), encoding="utf-8") as f:
+        fuente = f.read() * args.copias
+    ok, raiz, _ = parse_with_tree(fuente, trazar_tabla=False)
+    nodos = contar(raiz)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20 * nodos))   # las variantes recursivas lo necesitan
+
+    r_mano, t_mano = medir(lambda: a_mano(raiz))
+    def por_getattr():
+        v = PorGetattr(); v.recorrer(raiz); c = v.c
+        return c.usos, c.decls, c.maxima
+    r_get, t_get = medir(por_getattr)
+    def visitante():
+        c = Conteo().recorrer(raiz)
+        return c.usos, c.decls, c.maxima
+    r_vis, t_vis = medir(visitante)
+    assert r_mano == r_get == r_vis, (r_mano, r_get, r_vis)
+
+    print(f"Nodos: {nodos:,}  (usos, decls, anidamiento) = {r_vis}")
+    for nombre, t in (("recursión a mano (if/elif)", t_mano), ("getattr por nodo", t_get), ("Visitante (tabla)", t_vis)):
+        print(f"  {nombre:28s} {t * 1e3:8.1f} ms  {t / nodos * 1e9:6.0f} ns/nodo")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 import ply.lex as lex
 
 tokens = (
@@ -24,15 +26,13 @@ tokens = (
 )
 
 # ===== Palabras reservadas =====
-def t_int(t):     r'int';     return t
-def t_float(t):   r'float';   return t
-def t_double(t):  r'double';  return t
-def t_char(t):    r'char';    return t
-def t_void(t):    r'void';    return t  # reservada; la gramática no la usa como TYPE
-def t_if(t):      r'if';      return t
-def t_else(t):    r'else';    return t
-def t_while(t):   r'while';   return t
-def t_for(t):     r'for';     return t
+# Se clasifican dentro de t_identificador (un solo escaneo por palabra):
+# así `integer` o `format` son identificadores y no `int`+`eger` / `for`+`mat`.
+reservadas = {
+    'int': 'int', 'float': 'float', 'double': 'double', 'char': 'char',
+    'void': 'void',  # reservada; la gramática no la usa como TYPE
+    'if': 'if', 'else': 'else', 'while': 'while', 'for': 'for',
+}
 
 # ===== Operadores multi-caracter (antes que 1-char) =====
 t_EQ          = r'=='
@@ -82,6 +82,7 @@ def t_cadena(t):
 
 def t_identificador(t):
     r'[a-zA-Z_][a-zA-Z0-9_]*'
+    t.type = reservadas.get(t.value, 'identificador')
     return t
 
 # ===== Control de líneas / espacios / errores =====
@@ -91,11 +92,54 @@ def t_newline(t):
     r'\n+'
     t.lexer.lineno += len(t.value)
 
+# Errores: se acumulan en `lexer.errores` (sin imprimir). Una corrida de
+# caracteres ilegales consecutivos genera un solo diagnóstico; al llegar
+# a `lexer.max_errores` se aborta (`lexer.abortado`) y se descarta el resto.
+MAX_ERRORES = 100
+
+@dataclass
+class ErrorLexico:
+    pos: int
+    linea: int
+    texto: str
+
+    def __str__(self):
+        return f"[LEX] Illegal character(s) {self.texto!r} at line {self.linea}, pos {self.pos}"
+
+def registrar_error(lx, pos: int, texto: str):
+    """Anota un error léxico en `lx.errores` (uniendo corridas contiguas) y aborta al llegar a `lx.max_errores`."""
+    ult = lx.errores[-1] if lx.errores else None
+    if ult is not None and ult.pos + len(ult.texto) == pos:
+        ult.texto += texto           # continúa la corrida anterior
+    else:
+        lx.errores.append(ErrorLexico(pos, lx.lineno, texto))
+    if lx.max_errores is not None and len(lx.errores) >= lx.max_errores:
+        lx.abortado = True
+        lx.lexpos = len(lx.lexdata)
+
+# Caracteres que no pueden iniciar ningún token: se consumen como una
+# regla más (no pasan por t_error, que en PLY copia el resto de la entrada).
+def t_ilegal(t):
+    r'[^ \t\r\na-zA-Z0-9_+\-*/(){};=,"<>!&|$]+'
+    registrar_error(t.lexer, t.lexpos, t.value)
+
+# Quedan los que sí inician un token pero no lo completan ('&', '|', '"').
 def t_error(t):
-    print(f"[LEX] Illegal character '{t.value[0]}' at pos {t.lexpos}")
-    t.lexer.skip(1)
+    lx = t.lexer
+    lx.skip(1)
+    registrar_error(lx, lx.lexpos - 1, lx.lexdata[lx.lexpos - 1])
+
+def reiniciar(lx, codigo: str):
+    """Prepara `lx` para tokenizar `codigo` (línea 1, sin errores previos)."""
+    lx.lineno = 1
+    lx.errores = []
+    lx.abortado = False
+    lx.input(codigo)
 
 lexer = lex.lex()
+lexer.errores = []
+lexer.max_errores = MAX_ERRORES
+lexer.abortado = False
 
 
 
@@ -0,0 +1,507 @@
+import re
+import sys
+import ast
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+
+from ll1_parser_tree import Node, parse_with_tree
+
+# ============================================================
+# Ejecución de programas aceptados
+#   compilar(raiz): árbol de derivación -> fuente Python -> code object.
+#     - cada declaración se renombra según su ámbito (v<k>_<nombre>),
+#       así el programa corre como variables locales de una función;
+#     - las expresiones pasan por una forma intermedia en tuplas donde
+#       se pliegan las subexpresiones constantes (NUMBER op NUMBER ...);
+#     - semántica C: int/char enteros con división truncada hacia
+#       cero, float/double flotantes, relacionales/lógicos dan 1/0 y
+#       && / || cortocircuitan.
+#   interpretar(raiz): recorrido ingenuo del árbol en cada ejecución
+#     (la referencia contra la que se compara en bench/).
+#   Identificadores no declarados se tratan como globales implícitas
+#   inicializadas en 0. `max_iteraciones` acota el total de vueltas de
+#   while/for (ErrorEjecucion al superarlo).
+# ============================================================
+
+class ErrorEjecucion(Exception):
+    """Error en tiempo de ejecución del programa (división por cero, tipos incompatibles)."""
+
+_TIPOS = {'int': int, 'char': int, 'float': float, 'double': float}
+
+_BINARIAS = {'OR_EXPR', 'AND_EXPR', 'REL_EXPR', 'ADD_EXPR', 'MUL_EXPR'}
+
+_REL_PY = {'EQ': '==', 'NE': '!=', 'LT': '<', 'LE': '<=', 'GT': '>', 'GE': '>='}
+_ARIT_PY = {'PLUS': '+', 'MINUS': '-', 'TIMES': '*'}
+
+def _div_entera(a: int, b: int) -> int:
+    """División entera de C (trunca hacia cero)."""
+    q = a // b
+    if q < 0 and q * b != a:
+        q += 1
+    return q
+
+def _div(a, b):
+    if b == 0:
+        raise ErrorEjecucion("división por cero")
+    if type(a) is int and type(b) is int:
+        return _div_entera(a, b)
+    return a / b
+
+def _cadena(lexema: str) -> str:
+    try:
+        return ast.literal_eval(lexema)
+    except (ValueError, SyntaxError):
+        return lexema[1:-1]
+
+def _convertir(tipo, v):
+    """Conversión de asignación: a int trunca, a float promueve; cadenas y no declaradas quedan igual."""
+    if tipo is not None and type(v) in (int, float) and type(v) is not tipo:
+        return tipo(v)
+    return v
+
+# ===== Árbol de derivación -> expresión en tuplas =====
+#   ('num', v) | ('str', s) | ('var', nombre) | ('un', op, e) | ('bin', op, izq, der)
+def _expresion(n: Node):
+    while True:
+        lab = n.label
+        if lab in _BINARIAS:
+            izq = _expresion(n.children[0])
+            cola = n.children[1]
+            while cola.children:
+                op, der, cola = cola.children
+                izq = ('bin', op.token_type, izq, _expresion(der))
+            return izq
+        if lab == 'UNARY' and len(n.children) == 2:
+            return ('un', n.children[0].token_type, _expresion(n.children[1]))
+        if lab == 'PRIMARY':
+            c = n.children[0]
+            if c.label == 'LPAREN':
+                n = n.children[1]
+                continue
+            if c.label == 'NUMBER':
+                return ('num', c.lexeme)
+            if c.label == 'cadena':
+                return ('str', _cadena(c.lexeme))
+            return ('var', c.lexeme)
+        n = n.children[0]             # EXPR, EXPR_OPT, UNARY -> PRIMARY
+
+def _aplicar(op: str, a, b):
+    if op == 'PLUS': return a + b
+    if op == 'MINUS': return a - b
+    if op == 'TIMES': return a * b
+    if op == 'DIVIDE': return _div(a, b)
+    if op == 'EQ': return 1 if a == b else 0
+    if op == 'NE': return 1 if a != b else 0
+    if op == 'LT': return 1 if a < b else 0
+    if op == 'LE': return 1 if a <= b else 0
+    if op == 'GT': return 1 if a > b else 0
+    if op == 'GE': return 1 if a >= b else 0
+    raise ValueError(op)
+
+def plegar(e):
+    """Plegado de constantes sobre la forma en tuplas."""
+    tipo = e[0]
+    if tipo == 'un':
+        x = plegar(e[2])
+        if x[0] == 'num':
+            return ('num', -x[1] if e[1] == 'MINUS' else (0 if x[1] else 1))
+        return ('un', e[1], x)
+    if tipo != 'bin':
+        return e
+    op, a, b = e[1], plegar(e[2]), plegar(e[3])
+    if a[0] == 'num':
+        if op == 'LOGICAL_AND' and not a[1]:
+            return ('num', 0)
+        if op == 'LOGICAL_OR' and a[1]:
+            return ('num', 1)
+        if b[0] == 'num':
+            if op in ('LOGICAL_AND', 'LOGICAL_OR'):
+                return ('num', 1 if b[1] else 0)
+            if not (op == 'DIVIDE' and b[1] == 0):   # la división por cero queda para ejecución
+                return ('num', _aplicar(op, a[1], b[1]))
+    return ('bin', op, a, b)
+
+# ===== Generación de código Python =====
+class _Generador:
+    def __init__(self):
+        self.lineas: List[str] = []
+        self.ambitos: List[Dict[str, Tuple[str, Any]]] = [{}]   # nombre -> (nombre_py, tipo)
+        self.implicitas: Dict[str, str] = {}
+        self.declaradas: Dict[str, Any] = {}       # nombre_py -> tipo (todas, para el prólogo)
+        # Ámbito global: nombres con alguna DECL que puede no ejecutarse (cuerpo de
+        # if/while sin llaves) -> bandera "existe", y nombres con DECL que siempre se ejecuta
+        self.banderas: Dict[str, str] = {}
+        self.incondicionales: set = set()
+        self.contador = 0
+
+    # --- nombres ---
+    def declarar(self, nombre: str, tipo) -> str:
+        """Redeclarar en el mismo ámbito reusa la variable (como la celda de interpretar())."""
+        previo = self.ambitos[-1].get(nombre)
+        if previo is not None:
+            py = previo[0]
+        else:
+            self.contador += 1
+            py = f"v{self.contador}_{nombre}"
+        self.ambitos[-1][nombre] = (py, tipo)
+        self.declaradas[py] = tipo
+        return py
+
+    def resolver(self, nombre: str) -> Tuple[str, Any]:
+        for ambito in reversed(self.ambitos):
+            if nombre in ambito:
+                return ambito[nombre]
+        py = self.implicitas.setdefault(nombre, f"g_{nombre}")
+        return py, None
+
+    # --- expresiones: devuelven (fuente, tipo estático: int/float/str/None) ---
+    def expr(self, e) -> Tuple[str, Any]:
+        k = e[0]
+        if k == 'num':
+            return repr(e[1]), type(e[1])
+        if k == 'str':
+            return repr(e[1]), str
+        if k == 'var':
+            return self.resolver(e[1])
+        if k == 'un' and e[1] == 'MINUS':
+            s, t = self.expr(e[2])
+            return f"(-{s})", t
+        op = e[1]
+        if k == 'un' or op in _REL_PY or op in ('LOGICAL_AND', 'LOGICAL_OR'):
+            return f"(1 if {self.cond(e)} else 0)", int
+        (a, ta), (b, tb) = self.expr(e[2]), self.expr(e[3])
+        t = float if float in (ta, tb) else (int if ta is tb is int else None)
+        if op == 'DIVIDE':
+            if t is int:
+                return f"_divi({a}, {b})", int
+            return f"_div({a}, {b})", t
+        return f"({a} {_ARIT_PY[op]} {b})", t
+
+    def cond(self, e) -> str:
+        """Expresión en contexto de condición: bool de Python, sin materializar 1/0."""
+        if e[0] == 'un' and e[1] == 'LOGICAL_NOT':
+            return f"(not {self.cond(e[2])})"
+        if e[0] == 'bin':
+            op = e[1]
+            if op == 'LOGICAL_AND':
+                return f"({self.cond(e[2])} and {self.cond(e[3])})"
+            if op == 'LOGICAL_OR':
+                return f"({self.cond(e[2])} or {self.cond(e[3])})"
+            if op in _REL_PY:
+                return f"({self.expr(e[2])[0]} {_REL_PY[op]} {self.expr(e[3])[0]})"
+        return self.expr(e)[0]
+
+    def condicion(self, n: Node) -> str:
+        return self.cond(plegar(_expresion(n)))
+
+    def valor(self, n: Node, destino) -> str:
+        """Valor a asignar a una variable de tipo `destino`.
+
+        El tipo declarado no alcanza para omitir la conversión: una variable
+        int puede guardar una cadena (int a = "3";). Solo los literales
+        numéricos se convierten al compilar; el resto se chequea en ejecución,
+        con el caso común (ya es del tipo destino) en línea sin llamar a _conv.
+        """
+        e = plegar(_expresion(n))
+        s, _ = self.expr(e)
+        if destino is None or e[0] == 'str':
+            return s
+        if e[0] == 'num':
+            return repr(_convertir(destino, e[1]))
+        d = destino.__name__
+        return f"(_v if (_v := {s}).__class__ is {d} else _conv({d}, _v))"
+
+    # --- sentencias ---
+    def emitir(self, ind: int, linea: str):
+        self.lineas.append("    " * ind + linea)
+
+    def iteracion(self, ind: int):
+        """Descuenta una vuelta del presupuesto de iteraciones (_it)."""
+        self.emitir(ind, "_it -= 1")
+        self.emitir(ind, "if _it < 0: _agotado()")
+
+    def bloque(self, ind: int, nodos):
+        """Emite una suite; si quedó vacía agrega 'pass'."""
+        antes = len(self.lineas)
+        for n in nodos:
+            self.sentencia(n, ind)
+        if len(self.lineas) == antes:
+            self.emitir(ind, "pass")
+
+    def lista(self, n: Node):
+        """STMT_LIST -> STMT STMT_LIST | ε, sin recursión."""
+        while n.children:
+            yield n.children[0]
+            n = n.children[1]
+
+    def inits(self, tipo_nodo: Node, lista: Node, ind: int):
+        tipo = _TIPOS[tipo_nodo.children[0].label]
+        init, cola = lista.children
+        while True:
+            ident, opt = init.children
+            # el inicializador ve al propio nombre ya declarado (como en C) y con valor 0,
+            # como en interpretar(): dentro de un bucle no arrastra el de la vuelta anterior
+            py = self.declarar(ident.lexeme, tipo)
+            valor = self.valor(opt.children[1], tipo) if opt.children else repr(tipo(0))
+            if re.search(rf"\b{py}\b", valor):
+                self.emitir(ind, f"{py} = {tipo(0)!r}")
+            self.emitir(ind, f"{py} = {valor}")
+            if len(self.ambitos) == 1:
+                if ind > 1:
+                    # cuerpo de if/while sin llaves: solo figura en el resultado si se ejecutó
+                    bandera = self.banderas.setdefault(ident.lexeme, f"d_{ident.lexeme}")
+                    self.emitir(ind, f"{bandera} = True")
+                else:
+                    self.incondicionales.add(ident.lexeme)
+            if not cola.children:
+                break
+            _, init, cola = cola.children
+
+    def asignacion(self, core: Node, ind: int):
+        ident, _, expr = core.children
+        nombre = ident.lexeme
+        py, tipo = self.resolver(nombre)
+        self.emitir(ind, f"{py} = {self.valor(expr, tipo)}")
+        if (nombre in self.banderas and nombre not in self.incondicionales
+                and self.ambitos[0][nombre][0] == py):
+            # en interpretar() la asignación crea la global implícita: el nombre pasa a existir
+            self.emitir(ind, f"{self.banderas[nombre]} = True")
+
+    def sentencia(self, stmt: Node, ind: int):
+        c = stmt.children[0]
+        lab = c.label
+        if lab == 'DECL':
+            self.inits(c.children[0], c.children[1], ind)
+        elif lab == 'ASSIGN':
+            self.asignacion(c.children[0], ind)
+        elif lab == 'IF_STMT':
+            _, _, cond, _, entonces, cola = c.children
+            self.emitir(ind, f"if {self.condicion(cond)}:")
+            self.bloque(ind + 1, [entonces])
+            if cola.children:
+                self.emitir(ind, "else:")
+                self.bloque(ind + 1, [cola.children[1]])
+        elif lab == 'WHILE_STMT':
+            _, _, cond, _, cuerpo = c.children
+            self.emitir(ind, f"while {self.condicion(cond)}:")
+            self.iteracion(ind + 1)
+            self.bloque(ind + 1, [cuerpo])
+        elif lab == 'FOR_STMT':
+            _, _, ini, _, cond, _, post, _, cuerpo = c.children
+            self.ambitos.append({})
+            if ini.children:
+                x = ini.children[0]
+                if x.label == 'DECL_NO_SEMI':
+                    self.inits(x.children[0], x.children[1], ind)
+                else:
+                    self.asignacion(x, ind)
+            self.emitir(ind, f"while {self.condicion(cond) if cond.children else 'True'}:")
+            self.iteracion(ind + 1)
+            self.bloque(ind + 1, [cuerpo])
+            if post.children:                     # la gramática no tiene continue/break
+                self.asignacion(post.children[0], ind + 1)
+            self.ambitos.pop()
+        elif lab == 'BLOCK':
+            self.ambitos.append({})
+            for s in self.lista(c.children[1]):
+                self.sentencia(s, ind)
+            self.ambitos.pop()
+        # EMPTY: nada
+
+    def programa(self, raiz: Node) -> str:
+        self.bloque(1, self.lista(raiz.children[0]))
+        cuerpo = self.lineas
+        condicionales = {n: py for n, (py, _) in self.ambitos[0].items()
+                         if n in self.banderas and n not in self.incondicionales}
+        visibles = {n: py for n, (py, _) in self.ambitos[0].items() if n not in condicionales}
+        visibles.update({n: py for n, py in self.implicitas.items() if n not in visibles})
+        # prólogo: toda variable tiene valor aunque su DECL no llegue a ejecutarse
+        cabecera = (["def _programa(_it):"]
+                    + [f"    {py} = 0" for py in self.implicitas.values()]
+                    + [f"    {py} = {tipo(0)!r}" for py, tipo in self.declaradas.items()]
+                    + [f"    {b} = False" for b in self.banderas.values()])
+        retorno = ["    _r = {" + ", ".join(f"{n!r}: {py}" for n, py in visibles.items()) + "}"]
+        for n, py in condicionales.items():
+            retorno.append(f"    if {self.banderas[n]}: _r[{n!r}] = {py}")
+        retorno.append("    return _r")
+        return "\n".join(cabecera + cuerpo + retorno) + "\n"
+
+class Programa:
+    """Programa compilado: `fuente` (Python generado) y `ejecutar()` -> variables visibles al final."""
+
+    def __init__(self, fuente: str):
+        self.fuente = fuente
+        entorno = {"_divi": _div_entera_seguro, "_div": _div, "_conv": _convertir, "_agotado": _agotado}
+        exec(compile(fuente, "<programa>", "exec"), entorno)
+        self._funcion = entorno["_programa"]
+
+    def ejecutar(self, max_iteraciones: Optional[int] = None) -> Dict[str, Any]:
+        try:
+            return self._funcion(sys.maxsize if max_iteraciones is None else max_iteraciones)
+        except ZeroDivisionError:
+            raise ErrorEjecucion("división por cero") from None
+        except (TypeError, ValueError) as e:
+            raise ErrorEjecucion(f"tipos incompatibles: {e}") from None
+
+def _agotado():
+    raise ErrorEjecucion("se superó el máximo de iteraciones")
+
+def _div_entera_seguro(a: int, b: int) -> int:
+    if b == 0:
+        raise ErrorEjecucion("división por cero")
+    return _div_entera(a, b)
+
+def compilar(raiz: Node) -> Programa:
+    """Compila un árbol aceptado por parse_with_tree."""
+    return Programa(_Generador().programa(raiz))
+
+def _arbol(codigo: str) -> Node:
+    ok, raiz, _ = parse_with_tree(codigo, trazar_tabla=False)
+    if not ok:
+        raise ValueError("el programa no es aceptado por el parser")
+    return raiz
+
+def compilar_codigo(codigo: str) -> Programa:
+    return compilar(_arbol(codigo))
+
+# ===== Intérprete ingenuo (recorre el árbol en cada ejecución) =====
+def interpretar(raiz: Node, max_iteraciones: Optional[int] = None) -> Dict[str, Any]:
+    """Ejecuta recorriendo el árbol de derivación; mismo resultado que compilar(raiz).ejecutar()."""
+    restantes = sys.maxsize if max_iteraciones is None else max_iteraciones
+    ambitos: List[Dict[str, list]] = [{}]      # nombre -> [tipo, valor]
+    implicitas: Dict[str, list] = {}
+
+    def celda(nombre):
+        for a in reversed(ambitos):
+            if nombre in a:
+                return a[nombre]
+        return implicitas.setdefault(nombre, [None, 0])
+
+    def ev(n: Node):
+        lab = n.label
+        if lab in _BINARIAS:
+            v = ev(n.children[0])
+            cola = n.children[1]
+            while cola.children:
+                op, der, cola = cola.children
+                t = op.label
+                if t == 'LOGICAL_AND':
+                    v = 1 if v and ev(der) else 0
+                elif t == 'LOGICAL_OR':
+                    v = 1 if v or ev(der) else 0
+                else:
+                    v = _aplicar(t, v, ev(der))
+            return v
+        if lab == 'UNARY':
+            if len(n.children) == 2:
+                v = ev(n.children[1])
+                return -v if n.children[0].label == 'MINUS' else (0 if v else 1)
+            return ev(n.children[0])
+        if lab == 'PRIMARY':
+            c = n.children[0]
+            if c.label == 'LPAREN':
+                return ev(n.children[1])
+            if c.label == 'NUMBER':
+                return c.lexeme
+            if c.label == 'cadena':
+                return _cadena(c.lexeme)
+            return celda(c.lexeme)[1]
+        return ev(n.children[0])
+
+    def inits(tipo_nodo, lista):
+        tipo = _TIPOS[tipo_nodo.children[0].label]
+        init, cola = lista.children
+        while True:
+            ident, opt = init.children
+            c = ambitos[-1][ident.lexeme] = [tipo, tipo(0)]
+            if opt.children:
+                c[1] = _convertir(tipo, ev(opt.children[1]))
+            if not cola.children:
+                break
+            _, init, cola = cola.children
+
+    def asignar(core):
+        ident, _, expr = core.children
+        c = celda(ident.lexeme)
+        c[1] = _convertir(c[0], ev(expr))
+
+    def vuelta():
+        nonlocal restantes
+        restantes -= 1
+        if restantes < 0:
+            _agotado()
+
+    def lista(n):
+        while n.children:
+            sentencia(n.children[0])
+            n = n.children[1]
+
+    def sentencia(stmt):
+        c = stmt.children[0]
+        lab = c.label
+        if lab == 'DECL':
+            inits(c.children[0], c.children[1])
+        elif lab == 'ASSIGN':
+            asignar(c.children[0])
+        elif lab == 'IF_STMT':
+            if ev(c.children[2]):
+                sentencia(c.children[4])
+            elif c.children[5].children:
+                sentencia(c.children[5].children[1])
+        elif lab == 'WHILE_STMT':
+            while ev(c.children[2]):
+                vuelta()
+                sentencia(c.children[4])
+        elif lab == 'FOR_STMT':
+            _, _, ini, _, cond, _, post, _, cuerpo = c.children
+            ambitos.append({})
+            if ini.children:
+                x = ini.children[0]
+                if x.label == 'DECL_NO_SEMI':
+                    inits(x.children[0], x.children[1])
+                else:
+                    asignar(x)
+            while not cond.children or ev(cond):
+                vuelta()
+                sentencia(cuerpo)
+                if post.children:
+                    asignar(post.children[0])
+            ambitos.pop()
+        elif lab == 'BLOCK':
+            ambitos.append({})
+            lista(c.children[1])
+            ambitos.pop()
+
+    try:
+        lista(raiz.children[0])
+    except ZeroDivisionError:
+        raise ErrorEjecucion("división por cero") from None
+    except (TypeError, ValueError) as e:
+        raise ErrorEjecucion(f"tipos incompatibles: {e}") from None
+    out = {n: c[1] for n, c in ambitos[0].items()}
+    out.update({n: c[1] for n, c in implicitas.items() if n not in out})
+    return out
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Compila y ejecuta un programa aceptado por el parser.")
+    ap.add_argument("archivo")
+    ap.add_argument("--fuente", action="store_true", help="Muestra el Python generado")
+    ap.add_argument("--max-iteraciones", type=int, default=1_000_000, help="Vueltas de bucle permitidas (por defecto: %(default)s)")
+    ap.add_argument("--interpretar", action="store_true", help="Usa el intérprete sobre el árbol en vez de compilar")
+    args = ap.parse_args()
+
+    with open(args.archivo, encoding="utf-8") as f:
+        raiz = _arbol(f.read())
+    try:
+        if args.interpretar:
+            variables = interpretar(raiz, args.max_iteraciones)
+        else:
+            prog = compilar(raiz)
+            if args.fuente:
+                print(prog.fuente)
+            variables = prog.ejecutar(args.max_iteraciones)
+    except ErrorEjecucion as e:
+        print(f"[EJEC] {e}")
+        sys.exit(1)
+    for nombre, v in variables.items():
+        print(f"{nombre} = {v!r}")
@@ -0,0 +1,162 @@
+import io
+from typing import List, Optional
+
+from ll1_push import ParserIncremental
+from semantica import Oyente
+
+# ============================================================
+# Formateador en streaming (sin árbol)
+#   Oyente del parser: cada token consumido se escribe apenas llega,
+#   y las expansiones dicen dónde empieza una sentencia (STMT), si un
+#   '-'/'!' es unario (UNARY -> MINUS UNARY) y si la sentencia es el
+#   cuerpo de un if/while/for/else. El estado es O(anidamiento).
+#
+#   Estilo canónico:
+#     - una sentencia por línea, 4 espacios por nivel;
+#     - '{' al final del encabezado, '}' en su propia línea, '} else {';
+#     - un cuerpo sin llaves va en la línea siguiente con un nivel más;
+#     - espacios alrededor de operadores binarios y '=', después de ','
+#       y de ';' (dentro del for), ninguno dentro de los paréntesis.
+#   Los comentarios no son tokens y no se conservan.
+# ============================================================
+
+SANGRIA = "    "
+
+_PEGADO_ANTES = frozenset({'RPAREN', 'finInstruccion', 'coma'})
+
+_TEXTO = {
+    'PLUS': '+', 'MINUS': '-', 'TIMES': '*', 'DIVIDE': '/', 'LPAREN': '(', 'RPAREN': ')',
+    'inicioBloque': '{', 'finBloque': '}', 'finInstruccion': ';', 'asignacion': '=',
+    'EQ': '==', 'NE': '!=', 'LT': '<', 'LE': '<=', 'GT': '>', 'GE': '>=',
+    'LOGICAL_AND': '&&', 'LOGICAL_OR': '||', 'LOGICAL_NOT': '!', 'coma': ',',
+}
+
+class Formateador(Oyente):
+    """Escribe en `salida` (archivo de texto) el programa con formato canónico."""
+
+    def __init__(self, salida, tam_buffer: int = 1 << 10):
+        self._salida = salida
+        self._buf: List[str] = []
+        self._tam_buffer = tam_buffer
+        self.nivel = 0
+        self._anterior: Optional[str] = None     # tipo del último token escrito
+        self._salto = False                      # la próxima pieza va en línea nueva
+        self._pegar = False                      # la próxima pieza va sin espacio delante
+        self._unario = False                     # el próximo MINUS/NOT es unario
+        self._cuerpos: List[int] = []            # altura de pila de cada cuerpo sin llaves abierto
+
+    # --- escritura ---
+    def _poner(self, texto: str, tipo: str):
+        if self._anterior is None:
+            pass
+        elif self._salto and not (tipo == 'else' and self._anterior == 'finBloque'):
+            self._buf.append("\n" + SANGRIA * self.nivel)
+        elif not ((self._pegar and not tipo == self._anterior == 'MINUS') or tipo in _PEGADO_ANTES):
+            self._buf.append(" ")
+        self._buf.append(texto)
+        self._anterior, self._salto, self._pegar = tipo, False, False
+        if len(self._buf) >= self._tam_buffer:
+            self.vaciar()
+
+    def vaciar(self):
+        self._salida.write("".join(self._buf))
+        self._buf.clear()
+
+    def terminar(self):
+        if self._anterior is not None:
+            self._buf.append("\n")
+        self.vaciar()
+
+    # --- eventos del parser ---
+    def al_expandir(self, A, produccion, tok, pila):
+        if A == 'STMT':
+            cuerpo = self._anterior in ('RPAREN', 'else')
+            if not cuerpo:
+                self._salto = True
+            elif produccion[0] == 'BLOCK' or (self._anterior == 'else' and produccion[0] == 'IF_STMT'):
+                pass                                  # '{' o 'else if' en la misma línea
+            else:
+                self.nivel += 1
+                self._salto = True
+                self._cuerpos.append(len(pila) - len(produccion))
+        elif A == 'UNARY' and len(produccion) == 2:
+            self._unario = True
+        self._cerrar_cuerpos(pila)
+
+    def al_consumir(self, X, tok, pila):
+        if X == 'finBloque':
+            self.nivel -= 1
+            self._salto = True
+        elif X == 'else' and self._anterior != 'finBloque':
+            self._salto = True
+        texto = _TEXTO.get(X)
+        self._poner(str(tok.value) if texto is None else texto, X)
+        if X == 'inicioBloque':
+            self.nivel += 1
+        elif X == 'LPAREN':
+            self._pegar = True
+        elif self._unario and X in ('MINUS', 'LOGICAL_NOT'):
+            self._unario = False
+            self._pegar = True
+        if X == 'finBloque':
+            self._salto = True
+        self._cerrar_cuerpos(pila)
+
+    def _cerrar_cuerpos(self, pila):
+        while self._cuerpos and len(pila) <= self._cuerpos[-1]:
+            self._cuerpos.pop()
+            self.nivel -= 1
+
+def formatear(entrada, salida, tam_bloque: int = 1 << 16) -> bool:
+    """Lee `entrada` (archivo binario o de texto) por bloques y escribe el formato en `salida`.
+
+    Memoria acotada por el bloque y el anidamiento, también sin espacios
+    en la entrada: ParserIncremental corta después de ; { } , ( ).
+    Devuelve False si la entrada no es aceptada (la salida queda incompleta).
+    """
+    fmt = Formateador(salida)
+    p = ParserIncremental(oyente=fmt)
+    while p.ok is None:
+        bloque = entrada.read(tam_bloque)
+        if not bloque:
+            p.close()
+            break
+        p.feed(bloque)
+        p.eventos.clear()                 # solo interesan los tokens: no acumular eventos
+    fmt.terminar()
+    return bool(p.ok)
+
+def formatear_texto(codigo: str) -> Optional[str]:
+    """Versión en memoria: devuelve el texto formateado o None si no parsea."""
+    salida = io.StringIO()
+    return salida.getvalue() if formatear(io.StringIO(codigo), salida) else None
+
+def misma_secuencia(a: str, b: str) -> bool:
+    """True si ambos textos producen los mismos tokens (tipo y valor)."""
+    from ll1_parser import _tokenizar
+    def clave(codigo):
+        return [(t.type, t.value) for t in _tokenizar(codigo) if t.type != 'eof']
+    return clave(a) == clave(b)
+
+if __name__ == "__main__":
+    import sys, argparse
+    ap = argparse.ArgumentParser(description="Formatea un programa con el estilo canónico (sin construir árbol).")
+    ap.add_argument("archivo")
+    ap.add_argument("-o", "--salida", help="Archivo de salida (por defecto: stdout)")
+    ap.add_argument("--verificar", action="store_true", help="Comprueba que la salida re-tokeniza igual que la entrada")
+    args = ap.parse_args()
+
+    with open(args.archivo, "rb") as entrada:
+        if args.salida:
+            with open(args.salida, "w", encoding="utf-8") as salida:
+                ok = formatear(entrada, salida)
+        else:
+            ok = formatear(entrada, sys.stdout)
+    if not ok:
+        print(f"[FMT] {args.archivo}: la entrada no es aceptada por el parser", file=sys.stderr)
+        sys.exit(1)
+    if args.verificar and args.salida:
+        with open(args.archivo, encoding="utf-8") as f1, open(args.salida, encoding="utf-8") as f2:
+            if not misma_secuencia(f1.read(), f2.read()):
+                print("[FMT] la salida no conserva la secuencia de tokens", file=sys.stderr)
+                sys.exit(1)
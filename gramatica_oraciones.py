@@ -0,0 +1,105 @@
+import ply.lex as lex
+
+from c_lexer import registrar_error, MAX_ERRORES
+
+# ============================================================
+# Gramática de oraciones simples en español (sujeto + verbo +
+# complementos), registrada como "oracion_es" en gramaticas.py.
+#
+#   S         -> ORACIONES
+#   ORACIONES -> ORACION ORACIONES | ε
+#   ORACION   -> SN SV .
+#   SN        -> articulo sustantivo MOD | nombre
+#   MOD       -> adjetivo | ε
+#   SV        -> verbo OBJ SPS
+#   OBJ       -> SN | ε
+#   SPS       -> SP SPS | ε
+#   SP        -> preposicion SN
+# ============================================================
+
+tokens = (
+    'articulo', 'sustantivo', 'adjetivo', 'verbo', 'preposicion',
+    'nombre', 'desconocida', 'punto', 'eof',
+)
+
+# ===== Léxico (en minúsculas) =====
+lexico = {}
+for _cat, _palabras in {
+    'articulo': "el la los las un una unos unas",
+    'sustantivo': "perro gato niño niña casa carne parque libro presidente empresa reunión "
+                  "oficinas mes río mundo ciudad escuela maestro carta",
+    'adjetivo': "grande pequeño rojo nuevo nuevas diplomática pasado caudaloso feliz",
+    'verbo': "come lee visita visitó corre juega anunció es escribe tiene",
+    'preposicion': "en de con para por a desde hasta",
+}.items():
+    for _p in _palabras.split():
+        lexico[_p] = _cat
+
+def t_palabra(t):
+    r'[^\W\d_]+'
+    cat = lexico.get(t.value.lower())
+    if cat is None:
+        # palabra fuera del léxico: con mayúscula inicial se toma como nombre propio
+        cat = 'nombre' if t.value[0].isupper() else 'desconocida'
+    t.type = cat
+    return t
+
+t_punto = r'\.'
+t_eof   = r'\$'
+t_ignore = ' \t\r'
+
+def t_newline(t):
+    r'\n+'
+    t.lexer.lineno += len(t.value)
+
+def t_error(t):
+    lx = t.lexer
+    lx.skip(1)
+    registrar_error(lx, lx.lexpos - 1, lx.lexdata[lx.lexpos - 1])
+
+lexer = lex.lex()
+lexer.errores = []
+lexer.max_errores = MAX_ERRORES
+lexer.abortado = False
+
+tabla_oraciones = [
+# S
+['S', 'articulo', ['ORACIONES']],
+['S', 'nombre',   ['ORACIONES']],
+['S', 'eof',      ['ORACIONES']],
+
+# ORACIONES -> ORACION ORACIONES | ε
+['ORACIONES', 'articulo', ['ORACION','ORACIONES']],
+['ORACIONES', 'nombre',   ['ORACION','ORACIONES']],
+['ORACIONES', 'eof',      ['vacia']],
+
+# ORACION -> SN SV .
+['ORACION', 'articulo', ['SN','SV','punto']],
+['ORACION', 'nombre',   ['SN','SV','punto']],
+
+# SN -> articulo sustantivo MOD | nombre
+['SN', 'articulo', ['articulo','sustantivo','MOD']],
+['SN', 'nombre',   ['nombre']],
+
+# MOD -> adjetivo | ε
+['MOD', 'adjetivo',    ['adjetivo']],
+['MOD', 'verbo',       ['vacia']],
+['MOD', 'preposicion', ['vacia']],
+['MOD', 'punto',       ['vacia']],
+
+# SV -> verbo OBJ SPS
+['SV', 'verbo', ['verbo','OBJ','SPS']],
+
+# OBJ -> SN | ε
+['OBJ', 'articulo',    ['SN']],
+['OBJ', 'nombre',      ['SN']],
+['OBJ', 'preposicion', ['vacia']],
+['OBJ', 'punto',       ['vacia']],
+
+# SPS -> SP SPS | ε
+['SPS', 'preposicion', ['SP','SPS']],
+['SPS', 'punto',       ['vacia']],
+
+# SP -> preposicion SN
+['SP', 'preposicion', ['preposicion','SN']],
+]
@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
+
+# ============================================================
+# Registro de gramáticas
+#   Cada gramática agrupa sus terminales, su lexer y su tabla LL(1).
+#   Se registran con un cargador perezoso y se "compilan" (índice
+#   (A,a) -> producción, conjunto de terminales) una sola vez por
+#   proceso; luego se eligen por nombre en cada llamada:
+#       parse(codigo, gramatica="c_subset")
+# ============================================================
+
+GRAMATICA_POR_DEFECTO = "c_subset"
+
+@dataclass
+class Gramatica:
+    nombre: str
+    tokens: Tuple[str, ...]
+    lexer: Any                       # lexer PLY (con errores/abortado, ver c_lexer.reiniciar)
+    tabla: List[list]                # filas [A, a, [rhs...]] como tabla_ll1
+    inicial: str = 'S'
+    indice: Dict[Tuple[str, str], List[str]] = field(init=False, repr=False)
+    terminales: FrozenSet[str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.indice = {(A, a): prod for (A, a, prod) in self.tabla}
+        self.terminales = frozenset(self.tokens)
+
+_cargadores: Dict[str, Callable[[], Gramatica]] = {}
+_compiladas: Dict[str, Gramatica] = {}
+
+def registrar(nombre: str, cargador: Callable[[], Gramatica]):
+    """Registra `cargador` (sin argumentos, devuelve una Gramatica) bajo `nombre`."""
+    _cargadores[nombre] = cargador
+    _compiladas.pop(nombre, None)
+
+def obtener(nombre: str = GRAMATICA_POR_DEFECTO) -> Gramatica:
+    """Devuelve la gramática compilada; la primera vez la carga y la deja en caché."""
+    g = _compiladas.get(nombre)
+    if g is None:
+        if nombre not in _cargadores:
+            raise KeyError(f"Gramática desconocida '{nombre}'. Disponibles: {', '.join(disponibles())}")
+        g = _compiladas[nombre] = _cargadores[nombre]()
+    return g
+
+def disponibles() -> List[str]:
+    return sorted(_cargadores)
+
+# ===== Gramáticas incluidas =====
+def _c_subset() -> Gramatica:
+    from c_lexer import tokens, lexer
+    from ll1_parser import tabla_ll1
+    return Gramatica("c_subset", tokens, lexer, tabla_ll1)
+
+def _oracion_es() -> Gramatica:
+    from gramatica_oraciones import tokens, lexer, tabla_oraciones
+    return Gramatica("oracion_es", tokens, lexer, tabla_oraciones)
+
+registrar("c_subset", _c_subset)
+registrar("oracion_es", _oracion_es)
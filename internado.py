@@ -0,0 +1,78 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+from ll1_parser_tree import Node, parse_with_tree
+from gramaticas import GRAMATICA_POR_DEFECTO
+
+# ============================================================
+# Internado de subárboles (hash-consing)
+#   Un Internador guarda un nodo canónico por cada
+#   (label, token_type, lexema, identidades de los hijos canónicos):
+#   dos subárboles iguales terminan siendo el mismo objeto, dentro de
+#   un parse y entre todos los archivos de un lote que lo compartan.
+#   Además lleva el memo de sentencias simples de parse_with_tree
+#   (tokens de la sentencia -> subárbol STMT canónico).
+#
+#   Los nodos canónicos se comparten: tratarlos como inmutables.
+# ============================================================
+
+class Internador:
+    """Tabla de nodos canónicos y memo de sentencias; se pasa a parse_with_tree(..., internador=...)."""
+
+    def __init__(self):
+        self._tabla: Dict[Tuple, Node] = {}
+        self._canonicos: Set[int] = set()        # id() de los nodos de _tabla (vivos mientras estén ahí)
+        self.memo: Dict[Tuple, Node] = {}
+        self.vistos = 0                           # nodos procesados (no canónicos todavía)
+
+    def internar(self, raiz: Node) -> Node:
+        """Devuelve el canónico de `raiz`; reemplaza los hijos por sus canónicos (postorden, sin recursión)."""
+        canonicos, tabla = self._canonicos, self._tabla
+        if id(raiz) in canonicos:
+            return raiz
+        reemplazo: Dict[int, Node] = {}
+        pila: List[Tuple[Node, bool]] = [(raiz, False)]
+        while pila:
+            n, listo = pila.pop()
+            if not listo:
+                pila.append((n, True))
+                pila.extend((c, False) for c in n.children if id(c) not in canonicos)
+                continue
+            self.vistos += 1
+            if n.children:
+                n.children = [reemplazo.get(id(c), c) for c in n.children]
+            clave = (n.label, n.token_type, type(n.lexeme), n.lexeme, tuple(map(id, n.children)))
+            canon = tabla.setdefault(clave, n)
+            if canon is n:
+                canonicos.add(id(n))
+            reemplazo[id(n)] = canon
+        return reemplazo[id(raiz)]
+
+    @property
+    def unicos(self) -> int:
+        return len(self._tabla)
+
+    def limpiar(self):
+        self._tabla.clear(); self._canonicos.clear(); self.memo.clear()
+        self.vistos = 0
+
+def contar_nodos(raiz: Node) -> Tuple[int, int]:
+    """(nodos del árbol como recorrido, objetos Node distintos)."""
+    total, distintos, vistos = 0, 0, set()
+    pila = [raiz]
+    while pila:
+        n = pila.pop()
+        total += 1
+        if id(n) not in vistos:
+            vistos.add(id(n)); distintos += 1
+        pila.extend(n.children)
+    return total, distintos
+
+def parse_lote(fuentes: List[str], internador: Optional[Internador] = None,
+               gramatica: str = GRAMATICA_POR_DEFECTO) -> List[Tuple[bool, Node]]:
+    """parse_with_tree sobre un lote compartiendo el mismo Internador."""
+    internador = Internador() if internador is None else internador
+    out = []
+    for src in fuentes:
+        ok, raiz, _ = parse_with_tree(src, trazar_tabla=False, gramatica=gramatica, internador=internador)
+        out.append((ok, raiz))
+    return out
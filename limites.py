@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Optional
+
+# ============================================================
+# Topes de recursos por llamada a parse() (entrada no confiable)
+#   parse(codigo, limites=Limites(max_pasos=..., plazo=0.5, ...))
+#   devuelve LimiteExcedido (falsy) en lugar de True/False si se
+#   supera alguno. Los tokens, pasos y la pila se revisan cada `cada`
+#   tokens/pasos, así que un tope puede pasarse por menos de `cada`
+#   unidades antes de cortar. El plazo se lee en cada token durante el
+#   lexeo (un token puede costar O(n)) y cada `cada` pasos en el parse.
+# ============================================================
+
+@dataclass
+class Limites:
+    """Topes de una llamada a parse(); None = sin tope."""
+    max_bytes: Optional[int] = None      # tamaño de la entrada en UTF-8
+    max_tokens: Optional[int] = None
+    max_pila: Optional[int] = None       # profundidad de la pila LL(1)
+    max_pasos: Optional[int] = None      # iteraciones del bucle predictivo (match + expansión)
+    plazo: Optional[float] = None        # segundos de reloj desde que empieza parse()
+    cada: int = 1024
+
+    def __post_init__(self):
+        if self.cada < 1:
+            raise ValueError(f"Limites.cada debe ser >= 1 (se recibió {self.cada})")
+
+class LimiteExcedido:
+    """Resultado de parse() cuando se supera un tope: falso como un rechazo, pero distinguible."""
+
+    __slots__ = ("limite", "valor")
+
+    def __init__(self, limite: str, valor):
+        self.limite = limite        # nombre del campo de Limites que se superó
+        self.valor = valor          # medida al momento de cortar
+
+    def __bool__(self):
+        return False
+
+    def __str__(self):
+        return f"límite excedido: {self.limite} ({self.valor})"
+
+    def __repr__(self):
+        return f"LimiteExcedido({self.limite!r}, {self.valor!r})"
+
+def bytes_excedidos(codigo: str, max_bytes: int) -> Optional[int]:
+    """Tamaño en bytes si supera max_bytes, si no None; evita codificar cuando alcanza con len()."""
+    n = len(codigo)
+    if n > max_bytes:
+        return n                    # cota inferior: cada carácter ocupa al menos 1 byte
+    if 4 * n <= max_bytes:
+        return None
+    b = len(codigo.encode("utf-8", "surrogatepass"))
+    return b if b > max_bytes else None
@@ -0,0 +1,168 @@
+import asyncio, threading
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+from c_lexer import reiniciar
+from gramaticas import obtener, GRAMATICA_POR_DEFECTO
+from ll1_parser import _agregar_pila
+from ll1_parser_tree import parse_with_tree, Node
+
+# ============================================================
+# API asyncio: parse_async / parse_with_tree_async
+#   - Entradas chicas: el bucle predictivo corre en el event loop
+#     y cede el control cada `ceder_cada` pasos (lexer incluido).
+#   - Entradas grandes (>= umbral_executor caracteres): se delegan
+#     a un executor; la cancelación se propaga al hilo con un Event.
+#   - `timeout` por llamada (asyncio.TimeoutError al vencer).
+#   - `fuente` puede ser str/bytes o un stream async con read()
+#     (p.ej. asyncio.StreamReader).
+#   - `gramatica` elige la gramática registrada (gramaticas.py).
+# ============================================================
+
+CEDER_CADA = 2000            # pasos (tokens + acciones) entre cesiones
+UMBRAL_EXECUTOR = 1_000_000  # caracteres a partir de los cuales se usa el executor
+
+class ParseCancelado(Exception):
+    """El parse en el executor se detuvo porque la tarea fue cancelada."""
+
+async def leer_fuente(fuente, encoding: str = "utf-8", bloque: int = 1 << 16) -> str:
+    """Devuelve el texto de `fuente` (str, bytes o stream async con `read(n)`)."""
+    if isinstance(fuente, str):
+        return fuente
+    if isinstance(fuente, (bytes, bytearray)):
+        return bytes(fuente).decode(encoding)
+    partes = []
+    while True:
+        chunk = await fuente.read(bloque)
+        if not chunk:
+            break
+        partes.append(chunk)
+    if partes and isinstance(partes[0], str):
+        return "".join(partes)
+    return b"".join(partes).decode(encoding)
+
+def _pasos(codigo: str, ceder_cada: int, gramatica: str = GRAMATICA_POR_DEFECTO):
+    """Generador: lexea y reconoce `codigo`; hace `yield` cada `ceder_cada` pasos.
+
+    El resultado (bool) sale en StopIteration.value. Usa un clon del lexer
+    de la gramática para que varias llamadas intercaladas no compartan estado.
+    """
+    g = obtener(gramatica)
+    terminales, indice = g.terminales, g.indice
+    lx = g.lexer.clone()
+    reiniciar(lx, codigo)
+    toks: List[str] = []
+    n = 0
+    while True:
+        tok = lx.token()
+        if not tok:
+            break
+        toks.append(tok.type)
+        n += 1
+        if n >= ceder_cada:
+            n = 0
+            yield
+    if lx.abortado:
+        return False
+    if not toks or toks[-1] != 'eof':
+        toks.append('eof')
+
+    stack = ['eof', g.inicial]
+    i = 0
+    while True:
+        n += 1
+        if n >= ceder_cada:
+            n = 0
+            yield
+        a = toks[i]
+        X = stack[-1]
+        if X == a == 'eof':
+            return True
+        if X in terminales:
+            if X != a:
+                return False
+            stack.pop()
+            i += 1
+            continue
+        produccion = indice.get((X, a))
+        if produccion is None:
+            return False
+        stack.pop()
+        _agregar_pila(stack, produccion)
+
+def _correr_en_hilo(codigo: str, ceder_cada: int, gramatica: str, cancelado: threading.Event) -> bool:
+    gen = _pasos(codigo, ceder_cada, gramatica)
+    try:
+        while True:
+            next(gen)
+            if cancelado.is_set():
+                raise ParseCancelado()
+    except StopIteration as fin:
+        return fin.value
+
+async def _en_executor(executor: Optional[Executor], funcion, *args, cancelado: threading.Event):
+    loop = asyncio.get_running_loop()
+    fut = loop.run_in_executor(executor, funcion, *args)
+    try:
+        return await fut
+    except asyncio.CancelledError:
+        cancelado.set()
+        raise
+
+async def _parse_async(fuente, ceder_cada, umbral_executor, executor, gramatica) -> bool:
+    codigo = await leer_fuente(fuente)
+    if umbral_executor is not None and len(codigo) >= umbral_executor:
+        cancelado = threading.Event()
+        return await _en_executor(executor, _correr_en_hilo, codigo, ceder_cada, gramatica, cancelado,
+                                  cancelado=cancelado)
+    gen = _pasos(codigo, ceder_cada, gramatica)
+    try:
+        while True:
+            next(gen)
+            await asyncio.sleep(0)
+    except StopIteration as fin:
+        return fin.value
+
+async def parse_async(
+    fuente,
+    *,
+    ceder_cada: int = CEDER_CADA,
+    umbral_executor: Optional[int] = UMBRAL_EXECUTOR,
+    executor: Optional[Executor] = None,
+    timeout: Optional[float] = None,
+    gramatica: str = GRAMATICA_POR_DEFECTO,
+) -> bool:
+    """Versión async de `ll1_parser.parse(codigo, trazar=False, gramatica=...)`.
+
+    umbral_executor=None desactiva el executor (siempre cooperativo).
+    """
+    return await asyncio.wait_for(_parse_async(fuente, ceder_cada, umbral_executor, executor, gramatica), timeout)
+
+def _arbol_propio(codigo: str, gramatica: str):
+    # Cada llamada con su clon del lexer: el lexer global no se comparte
+    # entre el hilo y las llamadas que corren en el event loop.
+    lx = obtener(gramatica).lexer.clone()
+    return parse_with_tree(codigo, trazar_tabla=False, gramatica=gramatica, lx=lx)
+
+async def _parse_with_tree_async(fuente, umbral_executor, executor, gramatica):
+    codigo = await leer_fuente(fuente)
+    if umbral_executor is None or len(codigo) < umbral_executor:
+        return _arbol_propio(codigo, gramatica)
+    return await _en_executor(executor, _arbol_propio, codigo, gramatica, cancelado=threading.Event())
+
+async def parse_with_tree_async(
+    fuente,
+    *,
+    umbral_executor: Optional[int] = 20_000,
+    executor: Optional[Executor] = None,
+    timeout: Optional[float] = None,
+    gramatica: str = GRAMATICA_POR_DEFECTO,
+) -> Tuple[bool, Node, List[Dict[str, Any]]]:
+    """Versión async de `parse_with_tree(codigo, trazar_tabla=False, gramatica=...)`.
+
+    La construcción del árbol no es cooperativa: por encima de
+    `umbral_executor` caracteres se hace en el executor (None: nunca);
+    si la tarea se cancela el hilo termina su trabajo pero el resultado
+    se descarta.
+    """
+    return await asyncio.wait_for(_parse_with_tree_async(fuente, umbral_executor, executor, gramatica), timeout)
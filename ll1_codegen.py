@@ -0,0 +1,221 @@
+import os, sys, glob, types, hashlib, importlib, argparse, tempfile, subprocess
+import importlib.util
+
+from gramaticas import obtener, GRAMATICA_POR_DEFECTO
+from ll1_parser import tabla_ll1, _tokenizar
+
+# ============================================================
+# Generador de parser especializado a partir de tabla_ll1
+#   - Una función por No Terminal (descenso recursivo) con
+#     despacho por lookahead; la recursión por la derecha
+#     (STMT_LIST, *_TAIL, *_P) se convierte en bucle.
+#   - Si la entrada anida demasiado (RecursionError) se usa
+#     el reconocedor de pila explícita generado en el mismo módulo.
+#   - El módulo lleva la huella de la tabla: si la tabla cambia,
+#     se regenera solo al cargarlo.
+#   - Un módulo por gramática registrada (gramaticas.py):
+#     _ll1_generado.py para la por defecto, _ll1_generado_<nombre>.py
+#     para las demás.
+# ============================================================
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MODULO = "_ll1_generado"
+RUTA_MODULO = os.path.join(ROOT, MODULO + ".py")
+VERSION_GENERADOR = 2   # subir si cambia el código que se genera
+
+_modulos = {}           # gramática -> módulo ya cargado y verificado
+
+def nombre_modulo(gramatica: str = GRAMATICA_POR_DEFECTO) -> str:
+    return MODULO if gramatica == GRAMATICA_POR_DEFECTO else f"{MODULO}_{gramatica}"
+
+def _ruta(modulo: str) -> str:
+    return os.path.join(ROOT, modulo + ".py")
+
+def huella_tabla(tabla=tabla_ll1, inicial: str = 'S') -> str:
+    """SHA-1 de la tabla normalizada (independiente del orden de filas), del inicial y del generador."""
+    filas = sorted((A, a, tuple(prod)) for (A, a, prod) in tabla)
+    return hashlib.sha1(repr((VERSION_GENERADOR, inicial, filas)).encode("utf-8")).hexdigest()
+
+def _agrupar(tabla):
+    """{A: [(produccion, [terminales...]), ...]} preservando el orden de aparición."""
+    grupos = {}
+    for A, a, prod in tabla:
+        por_prod = grupos.setdefault(A, {})
+        por_prod.setdefault(tuple(prod), []).append(a)
+    return {A: list(por_prod.items()) for A, por_prod in grupos.items()}
+
+def generar_fuente(tabla=tabla_ll1, inicial: str = 'S') -> str:
+    """Devuelve el código Python del parser especializado para `tabla`."""
+    grupos = _agrupar(tabla)
+    no_terminales = set(grupos)
+    out = [
+        "# Archivo generado por ll1_codegen.py: NO EDITAR A MANO.",
+        f"HUELLA = {huella_tabla(tabla, inicial)!r}",
+        "",
+        "_TABLA = {",
+    ]
+    for A, a, prod in tabla:
+        out.append(f"    ({A!r}, {a!r}): {tuple(s for s in prod if s != 'vacia')!r},")
+    out.append("}")
+    out.append(f"_NO_TERMINALES = frozenset({sorted(no_terminales)!r})")
+    out.append("")
+
+    for A, producciones in grupos.items():
+        recursiva = any(prod[-1] == A for prod, _ in producciones)
+        out.append(f"def _nt_{A}(t, i):")
+        ind = "    "
+        if recursiva:
+            out.append(ind + "while True:")
+            ind += "    "
+        out.append(ind + "a = t[i]")
+        for prod, terminales in producciones:
+            if len(terminales) == 1:
+                out.append(ind + f"if a == {terminales[0]!r}:")
+            else:
+                out.append(ind + "if a in {" + ", ".join(repr(x) for x in sorted(terminales)) + "}:")
+            cuerpo = ind + "    "
+            simbolos = [s for s in prod if s != 'vacia']
+            bucle = recursiva and bool(simbolos) and simbolos[-1] == A
+            if bucle:
+                simbolos = simbolos[:-1]
+            for k, s in enumerate(simbolos):
+                if s in no_terminales:
+                    out.append(cuerpo + f"i = _nt_{s}(t, i)")
+                    out.append(cuerpo + "if i < 0: return -1")
+                elif k == 0 and terminales == [s]:
+                    # el lookahead ya es el terminal: match directo
+                    out.append(cuerpo + "i += 1")
+                else:
+                    out.append(cuerpo + f"if t[i] != {s!r}: return -1")
+                    out.append(cuerpo + "i += 1")
+            out.append(cuerpo + ("continue" if bucle else "return i"))
+        out.append(ind + "return -1")
+        out.append("")
+
+    out += [
+        "def _reconocer_pila(t):",
+        '    """Driver de pila explícita (sin recursión) sobre _TABLA."""',
+        f"    pila = ['eof', {inicial!r}]",
+        "    i = 0",
+        "    while True:",
+        "        a = t[i]",
+        "        X = pila[-1]",
+        "        if X == a == 'eof':",
+        "            return True",
+        "        if X not in _NO_TERMINALES:",
+        "            if X != a:",
+        "                return False",
+        "            pila.pop()",
+        "            i += 1",
+        "            continue",
+        "        prod = _TABLA.get((X, a))",
+        "        if prod is None:",
+        "            return False",
+        "        pila.pop()",
+        "        pila.extend(reversed(prod))",
+        "",
+        "def reconocer(t):",
+        '    """t: secuencia de tipos de token terminada en \'eof\'. Devuelve True si se acepta."""',
+        "    try:",
+        f"        i = _nt_{inicial}(t, 0)",
+        "    except RecursionError:",
+        "        return _reconocer_pila(t)",
+        "    return i >= 0 and t[i] == 'eof'",
+        "",
+    ]
+    return "\n".join(out)
+
+def _borrar_compilados(modulo: str):
+    for p in glob.glob(os.path.join(ROOT, modulo + ".*")):
+        if not p.endswith((".py", ".tmp")):     # los .tmp son escrituras en curso (regenerar)
+            os.remove(p)
+
+def _compilar(ruta: str) -> bool:
+    """Intenta compilar el módulo con Cython o mypyc si están instalados."""
+    if importlib.util.find_spec("Cython") is not None:
+        cmd = [sys.executable, "-m", "Cython.Build.Cythonize", "-i", "-3", ruta]
+    elif importlib.util.find_spec("mypyc") is not None:
+        cmd = [sys.executable, "-m", "mypyc", ruta]
+    else:
+        return False
+    r = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    return r.returncode == 0
+
+def regenerar(compilar: bool = False, gramatica: str = GRAMATICA_POR_DEFECTO) -> str:
+    """Escribe el módulo generado de `gramatica` (y opcionalmente lo compila). Devuelve su ruta.
+
+    Se escribe a un temporal del mismo directorio y se renombra con
+    os.replace: otro proceso que lo importe a la vez ve el módulo viejo
+    o el nuevo, nunca uno a medio escribir. OSError si no se puede escribir.
+    """
+    g = obtener(gramatica)
+    modulo = nombre_modulo(gramatica)
+    ruta = _ruta(modulo)
+    fd, tmp = tempfile.mkstemp(prefix=modulo + ".", suffix=".tmp", dir=ROOT)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(generar_fuente(g.tabla, g.inicial))
+        _borrar_compilados(modulo)
+        os.replace(tmp, ruta)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    if compilar:
+        _compilar(ruta)
+    importlib.invalidate_caches()
+    return ruta
+
+def cargar(compilar: bool = False, gramatica: str = GRAMATICA_POR_DEFECTO):
+    """Importa el parser generado de `gramatica`, regenerándolo si falta o si la tabla cambió.
+
+    La huella de la tabla se verifica una vez por proceso (las tablas no
+    cambian en ejecución); después devuelve el módulo ya cargado.
+    """
+    mod = _modulos.get(gramatica)
+    if mod is not None:
+        return mod
+    g = obtener(gramatica)
+    huella = huella_tabla(g.tabla, g.inicial)
+    modulo = nombre_modulo(gramatica)
+
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    if os.path.exists(_ruta(modulo)):
+        mod = sys.modules.get(modulo) or importlib.import_module(modulo)
+        if mod.HUELLA != huella:
+            mod = None
+    if mod is None:
+        try:
+            regenerar(compilar, gramatica)
+        except OSError:
+            mod = _en_memoria(gramatica)     # instalación de solo lectura: no se escribe nada
+        else:
+            sys.modules.pop(modulo, None)
+            mod = importlib.import_module(modulo)
+    _modulos[gramatica] = mod
+    return mod
+
+def _en_memoria(gramatica: str = GRAMATICA_POR_DEFECTO):
+    """Módulo generado sin archivo: exec de generar_fuente() en un módulo nuevo."""
+    g = obtener(gramatica)
+    modulo = nombre_modulo(gramatica)
+    mod = types.ModuleType(modulo)
+    exec(compile(generar_fuente(g.tabla, g.inicial), _ruta(modulo), "exec"), mod.__dict__)
+    return mod
+
+def parse_generado(codigo: str, gramatica: str = GRAMATICA_POR_DEFECTO) -> bool:
+    """Equivalente a ll1_parser.parse(codigo, trazar=False, gramatica=...) usando el parser generado."""
+    lx = obtener(gramatica).lexer
+    tipos = [t.type for t in _tokenizar(codigo, lx)]
+    if lx.abortado:
+        return False
+    return (_modulos.get(gramatica) or cargar(gramatica=gramatica)).reconocer(tipos)
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Genera el parser especializado a partir de la tabla LL(1).")
+    ap.add_argument("--compilar", action="store_true", help="Compila con Cython/mypyc si están disponibles")
+    ap.add_argument("--gramatica", default=GRAMATICA_POR_DEFECTO, help="Gramática registrada (gramaticas.py)")
+    args = ap.parse_args()
+    ruta = regenerar(compilar=args.compilar, gramatica=args.gramatica)
+    print(f"Parser generado -> {ruta}")
@@ -1,5 +1,8 @@
 from shutil import get_terminal_size
-from c_lexer import tokens, lexer 
+from time import perf_counter
+from c_lexer import lexer, reiniciar
+from gramaticas import obtener, GRAMATICA_POR_DEFECTO
+from limites import Limites, LimiteExcedido, bytes_excedidos
 
 def _clip(s: str, w: int) -> str:
     """Recorta s a w columnas, agregando '…' si excede."""
@@ -315,25 +318,113 @@ def _agregar_pila(stack, produccion):
         if simbolo != 'vacia':
             stack.append(simbolo)
 
-def _tokenizar(codigo: str):
-    """Tokeniza con el lexer PLY; asegura 'eof' al final."""
-    lexer.lineno = 1
-    lexer.input(codigo)
+def _tokenizar(codigo: str, lx=lexer, limites: Limites | None = None, hasta: float | None = None):
+    """Tokeniza con el lexer PLY `lx`; asegura 'eof' al final.
+
+    Los errores léxicos quedan en `lx.errores`; si se agotó el
+    presupuesto (`lx.abortado`) el resto de la entrada no se tokeniza.
+    Con `limites` (max_tokens) y `hasta` (perf_counter límite) corta y
+    devuelve LimiteExcedido en vez de la lista.
+    """
+    reiniciar(lx, codigo)
     out = []
-    while True:
-        tok = lexer.token()
-        if not tok:
-            break
-        out.append(tok)
+    max_tokens = limites.max_tokens if limites is not None else None
+    if max_tokens is None and hasta is None:
+        while True:
+            tok = lx.token()
+            if not tok:
+                break
+            out.append(tok)
+    elif hasta is not None:
+        # Con plazo, el reloj se lee en cada token: un solo lx.token() puede
+        # costar O(n) (p.ej. '/*' sin cerrar re-escanea hasta el final), así
+        # que una tanda de `cada` tokens no acota el tiempo. perf_counter es barato.
+        while True:
+            tok = lx.token()
+            if not tok:
+                break
+            out.append(tok)
+            if perf_counter() > hasta:
+                return LimiteExcedido("plazo", limites.plazo)
+            if max_tokens is not None and len(out) > max_tokens:
+                return LimiteExcedido("max_tokens", len(out))
+    else:
+        tok, tanda = True, range(limites.cada)
+        while tok:
+            for _ in tanda:
+                tok = lx.token()
+                if not tok:
+                    break
+                out.append(tok)
+            if len(out) > max_tokens:
+                return LimiteExcedido("max_tokens", len(out))
     if not out or out[-1].type != 'eof':
         class _E: pass
-        e = _E(); e.type = 'eof'; e.value = None; e.lexpos = -1
+        e = _E(); e.type = 'eof'; e.value = None; e.lexpos = -1; e.lineno = lx.lineno
         out.append(e)
     return out
 
-def parse(codigo: str, trazar: bool = True, widths: tuple[int,int,int] | None = None) -> bool:
-    tokens_stream = _tokenizar(codigo)
-    stack = ['eof', 'S']        # tope = último elemento
+def parse(codigo: str, trazar: bool = True, widths: tuple[int,int,int] | None = None,
+          gramatica: str = GRAMATICA_POR_DEFECTO, diagnosticos: list | None = None,
+          estadisticas: dict | None = None, oyente=None,
+          limites: Limites | None = None) -> bool | LimiteExcedido:
+    """Devuelve True si `codigo` es aceptado.
+
+    Si se pasa `diagnosticos` (lista), se le agregan los errores léxicos
+    y, si falla, el error sintáctico, como strings.
+    Si se pasa `estadisticas` (dict), se completa con "t_lex" y "t_parse"
+    (segundos), "tokens" y "pila_max" (profundidad máxima de la pila).
+    Si se pasa `oyente` (ver semantica.Oyente), se le notifica cada paso
+    ya aplicado sobre la pila: `al_consumir(X, tok, pila)` tras un match y
+    `al_expandir(A, produccion, tok, pila)` tras una expansión.
+    Con `limites` (ver limites.Limites) devuelve LimiteExcedido (falsy)
+    si se supera algún tope de bytes, tokens, pila, pasos o tiempo.
+    """
+    g = obtener(gramatica)
+    terminales, indice = g.terminales, g.indice
+    medir = estadisticas is not None
+    t0 = perf_counter()
+    hasta = t0 + limites.plazo if limites is not None and limites.plazo is not None else None
+    pila_max = 2
+
+    def fin(resultado):
+        if medir:
+            estadisticas.update(t_lex=t1 - t0, t_parse=perf_counter() - t1,
+                                tokens=len(tokens_stream), pila_max=pila_max)
+        return resultado
+
+    def excedido(r: LimiteExcedido) -> LimiteExcedido:
+        msg = f"[LIM] {r}"
+        if trazar:
+            print(msg)
+        if diagnosticos is not None:
+            diagnosticos.append(msg)
+        return fin(r)
+
+    tokens_stream, t1 = [], t0
+    if limites is not None and limites.max_bytes is not None:
+        n = bytes_excedidos(codigo, limites.max_bytes)
+        if n is not None:
+            return excedido(LimiteExcedido("max_bytes", n))
+    tokens_stream = _tokenizar(codigo, g.lexer, limites, hasta)
+    t1 = perf_counter()
+    if isinstance(tokens_stream, LimiteExcedido):
+        r, tokens_stream = tokens_stream, []
+        return excedido(r)
+
+    if trazar:
+        for err in g.lexer.errores:
+            print(err)
+    if diagnosticos is not None:
+        diagnosticos.extend(str(err) for err in g.lexer.errores)
+    if g.lexer.abortado:
+        msg = f"[LEX] demasiados errores léxicos ({len(g.lexer.errores)}): se aborta"
+        if trazar:
+            print(msg)
+        if diagnosticos is not None:
+            diagnosticos.append(msg)
+        return fin(False)
+    stack = ['eof', g.inicial]  # tope = último elemento
     i = 0
 
     if widths is None:
@@ -349,11 +440,31 @@ def parse(codigo: str, trazar: bool = True, widths: tuple[int,int,int] | None =
     def look() -> str:
         return tokens_stream[i].type
 
+    def diagnosticar(msg: str):
+        if diagnosticos is not None:
+            diagnosticos.append(f"[SYN] línea {tokens_stream[i].lineno}: {msg}")
+
+    # Topes del bucle: se revisan cada `cada` pasos (sin tope: restantes < 0 nunca llega a 0)
+    restantes, pasos = -1, 0
+    if limites is not None and (limites.max_pasos is not None or limites.max_pila is not None or hasta is not None):
+        restantes = limites.cada
+
     if trazar:
         print(_format_row("Buffer", "Stack", "Acción", W))
         print(_format_row("-" * 6, "-" * 5, "-" * 6, W))
 
     while True:
+        restantes -= 1
+        if not restantes:
+            restantes = limites.cada
+            pasos += limites.cada
+            if limites.max_pasos is not None and pasos > limites.max_pasos:
+                return excedido(LimiteExcedido("max_pasos", pasos))
+            if limites.max_pila is not None and len(stack) > limites.max_pila:
+                return excedido(LimiteExcedido("max_pila", len(stack)))
+            if hasta is not None and perf_counter() > hasta:
+                return excedido(LimiteExcedido("plazo", limites.plazo))
+
         a = look()
         X = stack[-1]
 
@@ -361,27 +472,31 @@ def parse(codigo: str, trazar: bool = True, widths: tuple[int,int,int] | None =
         if X == a == 'eof':
             if trazar:
                 print(_format_row(a, show_stack(), "Aceptar", W))
-            return True
+            return fin(True)
 
         # Caso: X es terminal
-        if X in tokens:
+        if X in terminales:
             if X == a:
                 if trazar:
                     print(_format_row(a, show_stack(), f"match {X}", W))
                 stack.pop()
+                if oyente is not None:
+                    oyente.al_consumir(X, tokens_stream[i], stack)
                 i += 1
             else:
                 if trazar:
                     print(_format_row(a, show_stack(), f"[ERR] esperado {X}", W))
-                return False
+                diagnosticar(f"se esperaba '{X}' y llegó '{a}'")
+                return fin(False)
             continue
 
         # Caso: X es No Terminal
-        produccion = _buscar_en_tabla(X, a)
+        produccion = indice.get((X, a))
         if produccion is None:
             if trazar:
                 print(_format_row(a, show_stack(), f"[ERR] M[{X}][{a}] vacío", W))
-            return False
+            diagnosticar(f"no hay regla para M[{X}][{a}]")
+            return fin(False)
 
         rhs = 'ε' if produccion == ['vacia'] else ' '.join(produccion)
         if trazar:
@@ -389,3 +504,7 @@ def parse(codigo: str, trazar: bool = True, widths: tuple[int,int,int] | None =
 
         stack.pop()
         _agregar_pila(stack, produccion)
+        if oyente is not None:
+            oyente.al_expandir(X, produccion, tokens_stream[i], stack)
+        if medir and len(stack) > pila_max:
+            pila_max = len(stack)
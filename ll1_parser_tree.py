@@ -3,10 +3,11 @@ from typing import List, Optional, Tuple, Dict, Any
 from shutil import get_terminal_size
 import os, sys, glob, argparse
 
-from c_lexer import tokens, lexer            
-from ll1_parser import tabla_ll1            
+from c_lexer import lexer, reiniciar
+from gramaticas import obtener, disponibles, GRAMATICA_POR_DEFECTO
 
-INDEX: Dict[Tuple[str, str], List[str]] = {(A, a): prod for (A, a, prod) in tabla_ll1}
+# Índice de la gramática por defecto (el de cada gramática vive en el registro)
+INDEX: Dict[Tuple[str, str], List[str]] = obtener().indice
 
 def _clip(s: str, w: int) -> str:
     if s is None:
@@ -34,12 +35,14 @@ class Node:
         self.children.append(child)
         return child
 
-def _tokenize(src: str):
-    lexer.lineno = 1
-    lexer.input(src)
+# Primeros tokens de STMT -> DECL | ASSIGN | EMPTY (sentencias que terminan en el primer ';')
+_STMT_SIMPLES = frozenset({'int', 'float', 'double', 'char', 'identificador', 'finInstruccion'})
+
+def _tokenize(src: str, lx=lexer):
+    reiniciar(lx, src)
     out = []
     while True:
-        t = lexer.token()
+        t = lx.token()
         if not t:
             break
         out.append(t)
@@ -67,30 +70,26 @@ def print_tree(root: Node):
         rec(ch, "", i == len(root.children) - 1)
 
 def to_dot(root: Node) -> str:
+    """Exporta a Graphviz. Los ids se asignan en preorden (Node no es hashable)."""
     lines = ["digraph ParseTree {", '  node [shape=box, fontname="Menlo"];']
-    counter = {"i": 0}
-    ids: Dict[Node, str] = {}
-
-    def nid(n: Node) -> str:
-        if n in ids:
-            return ids[n]
-        counter["i"] += 1
-        ids[n] = f"n{counter['i']}"
-        return ids[n]
 
     def esc(s: str) -> str:
         return s.replace('"', '\\"')
 
-    def dfs(n: Node):
+    contador = 0
+    pendientes: List[Tuple[Any, Optional[str]]] = [(root, None)]
+    while pendientes:
+        n, padre = pendientes.pop()
+        contador += 1
+        nid = f"n{contador}"
+        if padre is not None:
+            lines.append(f'  {padre} -> {nid};')
         label = n.label
         if n.token_type and n.lexeme is not None:
             label += f"\\n[{n.token_type}:{n.lexeme}]"
-        lines.append(f'  {nid(n)} [label="{esc(label)}"];')
-        for ch in n.children:
-            lines.append(f'  {nid(n)} -> {nid(ch)};')
-            dfs(ch)
+        lines.append(f'  {nid} [label="{esc(label)}"];')
+        pendientes.extend((ch, nid) for ch in reversed(n.children))
 
-    dfs(root)
     lines.append("}")
     return "\n".join(lines)
 
@@ -98,21 +97,45 @@ def to_dot(root: Node) -> str:
 def parse_with_tree(
     codigo: str,
     trazar_tabla: bool = True,
-    widths: Optional[Tuple[int, int, int]] = None
+    widths: Optional[Tuple[int, int, int]] = None,
+    gramatica: str = GRAMATICA_POR_DEFECTO,
+    internador=None,
+    lx=None
 ) -> Tuple[bool, Node, List[Dict[str, Any]]]:
     """
     Devuelve: (ok, raiz_arbol, trace)
     trace: lista de eventos {"step","lookahead","stack","action":{...},"bufferIndex":i}
+    Con `internador` (ver internado.Internador) el árbol aceptado se devuelve
+    con subárboles idénticos compartidos, y las sentencias simples (DECL,
+    ASSIGN, EMPTY: terminan en el primer ';') ya vistas se toman de su memo
+    sin re-expandirlas (un evento "memo" en lugar de sus pasos).
+    `lx` reemplaza al lexer compartido de la gramática (p.ej. un
+    `lexer.clone()` por llamada, para parsear desde varios hilos).
     """
-    toks = _tokenize(codigo)
-    stack: List[str] = ['eof', 'S']           
-    root = Node('S')
+    g = obtener(gramatica)
+    terminales, indice = g.terminales, g.indice
+    if lx is None:
+        lx = g.lexer
+    toks = _tokenize(codigo, lx)
+    stack: List[str] = ['eof', g.inicial]
+    root = Node(g.inicial)
     node_stack: List[Optional[Node]] = [None, root]  
 
     i = 0
     step = 1
     trace: List[Dict[str, Any]] = []
 
+    memo = internador.memo if internador is not None else None
+    pendiente = None            # (altura de pila, clave, nodo) del STMT simple en curso
+    if memo is not None:
+        # sig_fin[k]: índice del primer ';' desde k
+        sig_fin = [len(toks)] * len(toks)
+        siguiente = len(toks)
+        for k in range(len(toks) - 1, -1, -1):
+            if toks[k].type == 'finInstruccion':
+                siguiente = k
+            sig_fin[k] = siguiente
+
     if widths is None:
         total = max(get_terminal_size((140, 40)).columns - 4, 100)
         W = (int(total * 0.30), int(total * 0.50), total - int(total * 0.30) - int(total * 0.50))
@@ -135,6 +158,16 @@ def parse_with_tree(
     def show_stack() -> str:
         return ' '.join(stack)
 
+    if trazar_tabla:
+        for err in lx.errores:
+            print(err)
+    if lx.abortado:
+        msg = f"demasiados errores léxicos ({len(lx.errores)})"
+        if trazar_tabla:
+            print(f"[LEX] {msg}: se aborta")
+        emit({"type": "error", "message": msg})
+        return False, root, trace
+
     if trazar_tabla:
         print(_format_row("Buffer", "Stack", "Acción", W))
         print(_format_row("-" * 6, "-" * 5, "-" * 6, W))
@@ -144,15 +177,21 @@ def parse_with_tree(
         X = stack[-1]
         Xnode = node_stack[-1]
 
+        if pendiente is not None and len(stack) <= pendiente[0]:
+            memo[pendiente[1]] = internador.internar(pendiente[2])
+            pendiente = None
+
         # Aceptación
         if X == a == 'eof':
             if trazar_tabla:
                 print(_format_row(a, show_stack(), "Aceptar", W))
             emit({"type": "accept"})
+            if internador is not None:
+                root = internador.internar(root)
             return True, root, trace
 
         # Caso: X es terminal
-        if X in tokens:
+        if X in terminales:
             if X == a:
                 if trazar_tabla:
                     print(_format_row(a, show_stack(), f"match {X}", W))
@@ -173,8 +212,23 @@ def parse_with_tree(
                 return False, root, trace
             continue
 
+        # Sentencia simple repetida: se reutiliza el subárbol del memo
+        if memo is not None and X == 'STMT' and a in _STMT_SIMPLES and Xnode is not None:
+            j = sig_fin[i]
+            clave = tuple((t.type, t.value) for t in toks[i:j + 1])
+            previo = memo.get(clave)
+            if previo is not None:
+                if trazar_tabla:
+                    print(_format_row(a, show_stack(), f"memo STMT ({j + 1 - i} tokens)", W))
+                emit({"type": "memo", "A": X, "tokens": j + 1 - i})
+                Xnode.children = list(previo.children)
+                stack.pop(); node_stack.pop()
+                i = j + 1
+                continue
+            pendiente = (len(stack) - 1, clave, Xnode)
+
         # Caso: X es No Terminal -> buscar producción
-        prod = INDEX.get((X, a))
+        prod = indice.get((X, a))
         if prod is None:
             msg = f"no hay regla para M[{X}][{a}]"
             if trazar_tabla:
@@ -229,6 +283,9 @@ if __name__ == "__main__":
     ap.add_argument("--no-trace", action="store_true", help="Oculta la traza (Buffer/Stack/Acción)")
     ap.add_argument("--tree", action="store_true", help="Imprime el árbol ASCII")
     ap.add_argument("--dot", action="store_true", help="Exporta un .dot junto al archivo de entrada")
+    ap.add_argument("--bin", action="store_true", help="Exporta el árbol en formato binario .llt (ver arbol_binario.py)")
+    ap.add_argument("--gramatica", default=GRAMATICA_POR_DEFECTO, choices=disponibles(),
+                    help="Gramática registrada a usar (por defecto: %(default)s)")
     args = ap.parse_args()
 
     targets = list(_expand_targets(args.targets)) if args.targets else []
@@ -236,7 +293,7 @@ if __name__ == "__main__":
         # Demo mínimo si no se pasan archivos
         demo = "int a, b; a = (b + 3) * -2;"
         print(">> Demo (sin archivos):", demo)
-        ok, raiz, _ = parse_with_tree(demo, trazar_tabla=not args.no_trace)
+        ok, raiz, _ = parse_with_tree(demo, trazar_tabla=not args.no_trace, gramatica=args.gramatica)
         print("\nResultado:", "OK" if ok else "FALLO")
         if args.tree:
             print("\nÁrbol de derivación (ASCII):")
@@ -246,6 +303,10 @@ if __name__ == "__main__":
             with open(out, "w", encoding="utf-8") as f:
                 f.write(to_dot(raiz))
             print(f"DOT -> {out}")
+        if args.bin and ok:
+            from arbol_binario import escribir
+            escribir(raiz, "demo_tree.llt")
+            print("LLT -> demo_tree.llt")
         sys.exit(0)
 
     exit_code = 0
@@ -254,7 +315,7 @@ if __name__ == "__main__":
         print(f"Archivo: {path}")
         print("=" * 80)
         src = _leer(path)
-        ok, raiz, _ = parse_with_tree(src, trazar_tabla=not args.no_trace)
+        ok, raiz, _ = parse_with_tree(src, trazar_tabla=not args.no_trace, gramatica=args.gramatica)
         print("\nResultado:", "OK" if ok else "FALLO")
 
         if args.tree:
@@ -267,6 +328,12 @@ if __name__ == "__main__":
                 f.write(to_dot(raiz))
             print(f"DOT -> {out}")
 
+        if args.bin and ok:
+            from arbol_binario import escribir
+            out = os.path.splitext(path)[0] + ".llt"
+            escribir(raiz, out)
+            print(f"LLT -> {out}")
+
         if not ok:
             exit_code = 1
 
@@ -0,0 +1,238 @@
+import codecs
+from typing import Any, Dict, List, Optional
+
+from c_lexer import reiniciar
+from gramaticas import obtener, GRAMATICA_POR_DEFECTO
+from ll1_parser import _agregar_pila
+
+# ============================================================
+# Parser "push": se alimenta por fragmentos (feed/close)
+#   - Un escáner de estado (normal / comentario / cadena) recorre
+#     cada carácter una sola vez y recuerda el último corte seguro:
+#     un punto donde ningún token puede continuar (después de un
+#     espacio o de ; { } , ( ) fuera de comentario/cadena, o justo al
+#     cerrar uno de ellos). Así una entrada sin espacios también se
+#     corta en cada sentencia.
+#   - Solo el texto hasta ese corte se pasa al lexer; la cola queda
+#     pendiente (lista de pedazos, sin re-concatenar en cada feed)
+#     hasta el próximo fragmento.
+#   - La pila LL(1) persiste entre fragmentos; cada token se consume
+#     apenas se produce.
+#   - Eventos (dicts, como en la traza de ll1_parser_tree):
+#       {"type": "lex_error", "pos", "line", "text"}
+#       {"type": "stmt", "line_start", "line_end", "pos_start", "pos_end"}
+#       {"type": "error", "message", "line"}
+#       {"type": "accept"}
+#   - Opcionalmente notifica a un oyente (semantica.Oyente) cada
+#     match/expansión, igual que parse(..., oyente=...).
+#   - `gramatica` elige la gramática registrada (gramaticas.py). Los
+#     eventos "stmt" solo se emiten para las que tienen STMT_LIST
+#     (c_subset); los cortes del escáner valen para cualquier lexer
+#     cuyos tokens no contengan esos caracteres.
+# ============================================================
+
+_NORMAL, _COMENTARIO_LINEA, _COMENTARIO_BLOQUE, _CADENA = range(4)
+_CORTES = " \t\r\n;{},()"      # ningún token sigue después de estos caracteres
+
+class ParserIncremental:
+    """Parser LL(1) resumible: `feed(chunk)` las veces necesarias y luego `close()`."""
+
+    def __init__(self, encoding: str = "utf-8", oyente=None, gramatica: str = GRAMATICA_POR_DEFECTO):
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        g = obtener(gramatica)
+        self._terminales, self._indice = g.terminales, g.indice
+        self._lx = g.lexer.clone()
+        reiniciar(self._lx, "")
+        self._partes: List[str] = []   # texto escaneado y pendiente (aún no tokenizado)
+        self._cola = ""         # últimos caracteres sin decidir ('/', '*' o '\\' al final)
+        self._estado = _NORMAL
+        self._offset = 0        # caracteres ya entregados al lexer
+        self._errores_vistos = 0
+
+        self.stack: List[str] = ['eof', g.inicial]
+        self.ok: Optional[bool] = None        # None mientras no hay veredicto
+        self.eventos: List[Dict[str, Any]] = []
+        self._nuevos: List[Dict[str, Any]] = []
+        self._inicio_stmt = None               # primer token de la sentencia en curso
+        self._ultimo = None                    # último token consumido
+        self._oyente = oyente
+
+    # ---------------- API ----------------
+    def feed(self, chunk) -> List[Dict[str, Any]]:
+        """Agrega un fragmento (str o bytes). Devuelve los eventos nuevos."""
+        if self.ok is not None:
+            return self._vaciar()
+        texto = self._decoder.decode(chunk) if isinstance(chunk, (bytes, bytearray)) else chunk
+        texto = self._cola + texto
+        corte, p = self._escanear(texto)
+        self._cola = texto[p:]
+        if corte > 0:
+            self._partes.append(texto[:corte])
+            segmento = "".join(self._partes)
+            self._partes = [texto[corte:p]]
+            self._lexear(segmento)
+        else:
+            self._partes.append(texto[:p])
+        return self._vaciar()
+
+    @property
+    def pendiente(self) -> int:
+        """Caracteres recibidos que todavía no pasaron al lexer."""
+        return sum(map(len, self._partes)) + len(self._cola)
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Fin de la entrada: tokeniza el resto y decide. Devuelve los eventos nuevos."""
+        if self.ok is None:
+            self._partes.append(self._cola + self._decoder.decode(b"", final=True))
+            segmento = "".join(self._partes)
+            self._partes, self._cola = [], ""
+            self._lexear(segmento)
+        if self.ok is None:
+            fin = _TokenEof(self._offset, self._lx.lineno)
+            self._consumir(fin)
+        return self._vaciar()
+
+    # ---------------- escáner de cortes ----------------
+    def _escanear(self, buf: str):
+        """Escanea `buf` desde el estado guardado. Devuelve (último corte o -1, hasta dónde decidió).
+
+        Lo que queda después del segundo valor se vuelve a escanear con el próximo fragmento.
+        """
+        p, n, estado, corte = 0, len(buf), self._estado, -1
+        while p < n:
+            if estado == _NORMAL:
+                q = p
+                while q < n and buf[q] not in '/"':
+                    q += 1
+                ult = max(buf.rfind(c, p, q) for c in _CORTES)
+                if ult >= p:
+                    corte = ult + 1
+                if q >= n:
+                    p = n
+                    break
+                if buf[q] == '"':
+                    estado, p = _CADENA, q + 1
+                    continue
+                if q + 1 >= n:          # '/' al final: falta ver el siguiente carácter
+                    p = q
+                    break
+                sig = buf[q + 1]
+                if sig == '*':
+                    estado, p = _COMENTARIO_BLOQUE, q + 2
+                elif sig == '/':
+                    estado, p = _COMENTARIO_LINEA, q + 2
+                else:
+                    p = q + 1
+            elif estado == _COMENTARIO_BLOQUE:
+                q = buf.find('*/', p)
+                if q < 0:
+                    p = max(p, n - 1)   # un '*' final puede cerrar con el próximo '/'
+                    break
+                estado, p = _NORMAL, q + 2
+                corte = p
+            elif estado == _COMENTARIO_LINEA:
+                q = buf.find('\n', p)
+                if q < 0:
+                    p = n
+                    break
+                estado, p = _NORMAL, q
+            else:  # _CADENA
+                q = p
+                while q < n and buf[q] not in '\\"':
+                    q += 1
+                if q >= n:
+                    p = n
+                    break
+                if buf[q] == '\\':
+                    if q + 1 >= n:
+                        p = q
+                        break
+                    p = q + 2
+                    continue
+                estado, p = _NORMAL, q + 1
+                corte = p
+        self._estado = estado
+        return corte, p
+
+    # ---------------- lexer + parser ----------------
+    def _lexear(self, segmento: str):
+        lx = self._lx
+        lx.input(segmento)
+        while self.ok is None:
+            tok = lx.token()
+            self._reportar_errores_lexicos()
+            if lx.abortado:
+                self._error(f"demasiados errores léxicos ({len(lx.errores)})", lx.lineno)
+                break
+            if not tok:
+                break
+            tok.lexpos += self._offset
+            tok.fin = lx.lexpos + self._offset
+            self._consumir(tok)
+        self._offset += len(segmento)
+
+    def _reportar_errores_lexicos(self):
+        errores = self._lx.errores
+        while self._errores_vistos < len(errores):
+            e = errores[self._errores_vistos]
+            self._emitir({"type": "lex_error", "pos": e.pos + self._offset, "line": e.linea, "text": e.texto})
+            self._errores_vistos += 1
+
+    def _consumir(self, tok):
+        stack = self.stack
+        a = tok.type
+        while True:
+            X = stack[-1]
+            if X == a == 'eof':
+                self._cerrar_sentencia()
+                self.ok = True
+                self._emitir({"type": "accept"})
+                return
+            if X in self._terminales:
+                if X != a:
+                    self._error(f"se esperaba '{X}' y llegó '{a}'", tok.lineno)
+                    return
+                stack.pop()
+                self._ultimo = tok
+                if self._oyente is not None:
+                    self._oyente.al_consumir(X, tok, stack)
+                if len(stack) == 2:
+                    self._cerrar_sentencia()
+                return
+            prod = self._indice.get((X, a))
+            if prod is None:
+                self._error(f"no hay regla para M[{X}][{a}]", tok.lineno)
+                return
+            if X == 'STMT_LIST' and len(stack) == 2 and prod != ['vacia']:
+                self._inicio_stmt = tok
+            stack.pop()
+            _agregar_pila(stack, prod)
+            if self._oyente is not None:
+                self._oyente.al_expandir(X, prod, tok, stack)
+            if len(stack) == 2:
+                self._cerrar_sentencia()
+
+    def _cerrar_sentencia(self):
+        """Con la pila en [eof, STMT_LIST] la sentencia de nivel superior quedó decidida."""
+        ini, fin = self._inicio_stmt, self._ultimo
+        if ini is None or fin is None or fin.lexpos < ini.lexpos:
+            return
+        self._inicio_stmt = None
+        self._emitir({"type": "stmt", "line_start": ini.lineno, "line_end": fin.lineno,
+                      "pos_start": ini.lexpos, "pos_end": fin.fin})
+
+    def _error(self, mensaje: str, linea: int):
+        self.ok = False
+        self._emitir({"type": "error", "message": mensaje, "line": linea})
+
+    def _emitir(self, evento: Dict[str, Any]):
+        self.eventos.append(evento)
+        self._nuevos.append(evento)
+
+    def _vaciar(self) -> List[Dict[str, Any]]:
+        nuevos, self._nuevos = self._nuevos, []
+        return nuevos
+
+class _TokenEof:
+    def __init__(self, pos: int, linea: int):
+        self.type = 'eof'; self.value = None; self.lexpos = self.fin = pos; self.lineno = linea
@@ -1,5 +1,13 @@
-import os, sys, glob
+import os, sys, csv, glob, json, time, hashlib, argparse
+from collections import Counter
 from ll1_parser import parse
+from gramaticas import obtener, GRAMATICA_POR_DEFECTO
+from referencias import IndiceReferencias
+
+try:
+    from inotify_simple import INotify, flags as _flags
+except ImportError:  # dependencia opcional: sin ella --watch sondea por intervalos
+    INotify = None
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
 TESTS_DIR = os.path.join(ROOT, "tests")
@@ -10,10 +18,29 @@ DEFAULT_EXPECT = {
     "mixed": None,  
 }
 
-def leer_caso(path):
-    """Devuelve (nombre, codigo, esperado) leyendo directiva si existe."""
-    nombre = os.path.relpath(path, TESTS_DIR)
-    carpeta = nombre.split(os.sep)[0]
+# Carpetas de tests/ con casos de otra gramática (tests/<carpeta>/{ok,fail,mixed}/...).
+# El resto de los casos usa la gramática por defecto (c_subset).
+GRAMATICA_POR_CARPETA = {
+    "oraciones": "oracion_es",
+}
+
+def _fuera_de_tests(path):
+    return os.path.relpath(os.path.abspath(path), TESTS_DIR).startswith(os.pardir)
+
+def _nombre_caso(path):
+    """Relativo a tests/; los archivos de afuera, tal como se pasaron."""
+    return os.path.normpath(path) if _fuera_de_tests(path) else os.path.relpath(path, TESTS_DIR)
+
+def leer_caso(path, exigir_esperado=True):
+    """Devuelve (nombre, codigo, esperado, gramatica) leyendo directiva si existe.
+
+    Con exigir_esperado=False un caso sin expectativa devuelve esperado=None
+    (solo se reporta el veredicto del parser) en lugar de ValueError.
+    """
+    nombre = _nombre_caso(path)
+    partes = nombre.split(os.sep)
+    gramatica = GRAMATICA_POR_CARPETA.get(partes[0], GRAMATICA_POR_DEFECTO)
+    carpeta = partes[1] if partes[0] in GRAMATICA_POR_CARPETA and len(partes) > 1 else partes[0]
     default = DEFAULT_EXPECT.get(carpeta, None)
 
     with open(path, "r", encoding="utf-8") as f:
@@ -26,54 +53,318 @@ def leer_caso(path):
         if val == "OK": esperado = True
         elif val in ("FALLO", "FAIL"): esperado = False
 
-    if esperado is None:
+    if esperado is None and exigir_esperado:
         raise ValueError(f"El caso '{nombre}' no define EXPECT y está en carpeta 'mixed'.")
 
-    return nombre, contenido, esperado
+    return nombre, contenido, esperado, gramatica
 
-def correr_archivo(path, trazar=False):
-    nombre, codigo, esperado = leer_caso(path)
+def correr_archivo(path, trazar=False, xref=None, exigir_esperado=True):
+    """Corre un caso e imprime el veredicto. Devuelve un dict con el resultado.
+    Si `xref` es un dict, agrega ahí el índice de referencias del caso (solo gramática C).
+    Sin expectativa (ver leer_caso) "esperado" y "correcto" quedan en None."""
+    nombre, codigo, esperado, gramatica = leer_caso(path, exigir_esperado)
     print(f"\n=== {nombre} ===")
-    ok = parse(codigo, trazar=trazar)
-    print("Resultado:", "OK" if ok else "FALLO", f"(esperado: {'OK' if esperado else 'FALLO'})")
-    return ok == esperado
+    diagnosticos, stats = [], {}
+    indice = IndiceReferencias(codigo) if xref is not None and gramatica == GRAMATICA_POR_DEFECTO else None
+    t0 = time.perf_counter()
+    ok = parse(codigo, trazar=trazar, gramatica=gramatica, diagnosticos=diagnosticos, estadisticas=stats,
+               oyente=indice)
+    segundos = time.perf_counter() - t0
+    if indice is not None:
+        xref[nombre.replace(os.sep, "/")] = indice.a_dict()
+    if esperado is None:
+        print("Resultado:", "OK" if ok else "FALLO", "(sin EXPECT: solo parse)")
+    else:
+        print("Resultado:", "OK" if ok else "FALLO", f"(esperado: {'OK' if esperado else 'FALLO'})")
+    # parse puede devolver LimiteExcedido (falsy): se compara su valor de verdad
+    return {
+        "caso": nombre.replace(os.sep, "/"),
+        "gramatica": gramatica,
+        "ok": bool(ok),
+        "esperado": esperado,
+        "correcto": None if esperado is None else bool(ok) == esperado,
+        "segundos": segundos,
+        "t_lex": stats["t_lex"],
+        "t_parse": stats["t_parse"],
+        "tokens": stats["tokens"],
+        "pila_max": stats["pila_max"],
+        "diagnosticos": diagnosticos,
+    }
 
 def recolectar_paths():
-    patrones = [
-        os.path.join(TESTS_DIR, "ok", "*"),
-        os.path.join(TESTS_DIR, "fail", "*"),
-        os.path.join(TESTS_DIR, "mixed", "*"),
-    ]
+    patrones = []
+    for base in [TESTS_DIR] + [os.path.join(TESTS_DIR, c) for c in GRAMATICA_POR_CARPETA]:
+        for carpeta in ("ok", "fail", "mixed"):
+            patrones.append(os.path.join(base, carpeta, "*"))
     files = []
     for pat in patrones:
         files.extend(glob.glob(pat))
     # Orden estable
     return sorted(f for f in files if os.path.isfile(f))
 
-def main():
+def leer_shard(texto):
+    """'i/N' (1 <= i <= N) -> (i, N)."""
+    try:
+        i, n = (int(x) for x in texto.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"shard inválido '{texto}' (formato: i/N)")
+    if not 1 <= i <= n:
+        raise argparse.ArgumentTypeError(f"shard inválido '{texto}' (se requiere 1 <= i <= N)")
+    return i, n
+
+def en_shard(path, shard):
+    """Asignación estable por hash del nombre relativo (no depende del orden ni de PYTHONHASHSEED)."""
+    if shard is None:
+        return True
+    i, n = shard
+    nombre = os.path.relpath(path, TESTS_DIR).replace(os.sep, "/")
+    return int(hashlib.sha1(nombre.encode("utf-8")).hexdigest()[:8], 16) % n == i - 1
+
+def resumir(resultados, errores):
+    """Imprime el resumen habitual y devuelve el código de salida.
+    Los casos sin expectativa (correcto=None) no cuentan para el resumen."""
+    bien = sum(1 for r in resultados if r["correcto"])
+    solo_parse = sum(1 for r in resultados if r["correcto"] is None)
+    total = len(resultados) - solo_parse + len(errores)
+    print(f"\nResumen: {bien}/{total} casos en el resultado esperado.")
+    if solo_parse:
+        aceptados = sum(1 for r in resultados if r["correcto"] is None and r["ok"])
+        print(f"Sin EXPECT (solo parse): {aceptados}/{solo_parse} aceptados.")
+    return 0 if bien == total else 1
+
+def reporte_tiempos(resultados, n):
+    """Tabla de los n casos más lentos y throughput agregado."""
+    if not resultados:
+        return
+    if n > 0:
+        print(f"\nCasos más lentos (top {n}):")
+        print(f"  {'caso':44s} {'total ms':>9s} {'lex ms':>8s} {'parse ms':>9s} {'tokens':>7s} {'pila':>5s}")
+        for r in sorted(resultados, key=lambda r: r["segundos"], reverse=True)[:n]:
+            print(f"  {r['caso'][:44]:44s} {r['segundos'] * 1e3:9.2f} {r.get('t_lex', 0) * 1e3:8.2f} "
+                  f"{r.get('t_parse', 0) * 1e3:9.2f} {r.get('tokens', 0):7d} {r.get('pila_max', 0):5d}")
+    tokens = sum(r.get("tokens", 0) for r in resultados)
+    t_lex = sum(r.get("t_lex", 0) for r in resultados)
+    t_parse = sum(r.get("t_parse", 0) for r in resultados)
+    t_total = t_lex + t_parse
+    print(f"\nTokens: {tokens} en {t_total:.3f}s ({tokens / t_total:,.0f} tokens/s; "
+          f"lex {t_lex:.3f}s, parse {t_parse:.3f}s)" if t_total > 0 else f"\nTokens: {tokens}")
+
+CAMPOS_CSV = ("caso", "gramatica", "ok", "esperado", "correcto", "segundos", "t_lex", "t_parse", "tokens", "pila_max")
+
+def escribir_csv(path, resultados):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=CAMPOS_CSV, extrasaction="ignore")
+        w.writeheader()
+        w.writerows(resultados)
+
+def escribir_json(path, shard, resultados, errores):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"shard": list(shard) if shard else None,
+                   "resultados": resultados, "errores": errores}, f, ensure_ascii=False, indent=1)
+
+def escribir_xref(path, xref):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(xref, f, ensure_ascii=False, separators=(",", ":"))
+
+def merge(paths, lentos=5):
+    """Combina los JSON de varios shards en el resumen y código de salida habituales."""
+    resultados, errores = [], []
+    vistos, totales = set(), set()
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            datos = json.load(f)
+        if datos.get("shard"):
+            i, n = datos["shard"]
+            vistos.add(i); totales.add(n)
+        resultados.extend(datos["resultados"])
+        errores.extend(datos["errores"])
+
+    codigo = 0
+    if len(totales) > 1:
+        print(f"[MERGE] los archivos mezclan particiones distintas: N = {sorted(totales)}")
+        codigo = 1
+    elif totales:
+        faltan = sorted(set(range(1, totales.pop() + 1)) - vistos)
+        if faltan:
+            print(f"[MERGE] faltan shards: {faltan}")
+            codigo = 1
+    repetidos = sorted(c for c, k in Counter(r["caso"] for r in resultados).items() if k > 1)
+    if repetidos:
+        print(f"[MERGE] casos repetidos entre shards: {repetidos}")
+        codigo = 1
+
+    for r in sorted(resultados, key=lambda r: r["caso"]):
+        if not r["correcto"]:
+            print(f"[INCORRECTO] {r['caso']}: {'OK' if r['ok'] else 'FALLO'} "
+                  f"(esperado: {'OK' if r['esperado'] else 'FALLO'})")
+            for d in r["diagnosticos"]:
+                print(f"    {d}")
+    for e in errores:
+        print(f"[ERROR] {e['caso']}: {e['error']}")
+    reporte_tiempos(resultados, lentos)
+    return resumir(resultados, errores) or codigo
+
+# ===== Modo --watch =====
+def _expandir(paths):
+    """Archivos sueltos tal cual; de las carpetas, sus archivos directos."""
+    out = []
+    for p in paths:
+        if os.path.isdir(p):
+            out.extend(f for f in glob.glob(os.path.join(p, "*")) if os.path.isfile(f))
+        elif os.path.isfile(p):
+            out.append(p)
+    return out
+
+def _carpetas_vigiladas(extra):
+    carpetas = {os.path.dirname(p) for p in recolectar_paths()}
+    for base in [TESTS_DIR] + [os.path.join(TESTS_DIR, c) for c in GRAMATICA_POR_CARPETA]:
+        carpetas.update(os.path.join(base, c) for c in ("ok", "fail", "mixed"))
+    carpetas.update(p if os.path.isdir(p) else os.path.dirname(os.path.abspath(p)) for p in extra)
+    return sorted(c for c in carpetas if os.path.isdir(c))
+
+def _esperar(inotify, intervalo):
+    if inotify is None:
+        time.sleep(intervalo)
+    else:
+        inotify.read(timeout=int(intervalo * 1000) if intervalo else None, read_delay=20)
+
+def vigilar(extra, intervalo=0.25):
+    """Proceso caliente: re-parsea solo los archivos nuevos o modificados y reimprime el resumen.
+
+    Un archivo se considera modificado si cambia (mtime, tamaño) y además su
+    SHA-1; tocarlo sin cambiar el contenido no lo vuelve a correr. Con
+    inotify_simple instalado se despierta por eventos; si no, sondea cada
+    `intervalo` segundos. Termina con Ctrl-C devolviendo el último código.
+    """
+    for nombre in {GRAMATICA_POR_DEFECTO, *GRAMATICA_POR_CARPETA.values()}:
+        obtener(nombre)
+    inotify = None
+    if INotify is not None:
+        inotify = INotify()
+        mascara = _flags.CLOSE_WRITE | _flags.MOVED_TO | _flags.CREATE | _flags.DELETE | _flags.MOVED_FROM
+        for carpeta in _carpetas_vigiladas(extra):
+            inotify.add_watch(carpeta, mascara)
+    print(f"[WATCH] vigilando tests/ y {len(extra)} ruta(s) extra "
+          f"({'inotify' if inotify is not None else f'sondeo cada {intervalo}s'}). Ctrl-C para salir.")
+
+    firmas = {}        # path -> ((mtime_ns, tamaño), sha1)
+    resultados = {}    # path -> dict de correr_archivo
+    errores = {}       # path -> {"caso", "error"}
+    codigo = 0
+    try:
+        while True:
+            t0 = time.perf_counter()
+            actuales = set(recolectar_paths()) | set(_expandir(extra))
+            cambiados = []
+            for path in sorted(actuales):
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                firma = (st.st_mtime_ns, st.st_size)
+                previo = firmas.get(path)
+                if previo is not None and previo[0] == firma:
+                    continue
+                with open(path, "rb") as f:
+                    h = hashlib.sha1(f.read()).hexdigest()
+                firmas[path] = (firma, h)
+                if previo is None or previo[1] != h:
+                    cambiados.append(path)
+            borrados = [p for p in firmas if p not in actuales]
+            for path in borrados:
+                firmas.pop(path); resultados.pop(path, None); errores.pop(path, None)
+
+            if cambiados or borrados:
+                for path in cambiados:
+                    errores.pop(path, None)
+                    try:
+                        # las rutas extra fuera de tests/ no tienen expectativa por carpeta:
+                        # sin //! EXPECT= se reporta solo el veredicto del parser
+                        resultados[path] = correr_archivo(path, trazar=False,
+                                                          exigir_esperado=not _fuera_de_tests(path))
+                    except Exception as e:
+                        resultados.pop(path, None)
+                        print(f"[ERROR] {path}: {e}")
+                        errores[path] = {"caso": _nombre_caso(path).replace(os.sep, "/"), "error": str(e)}
+                for path in borrados:
+                    print(f"\n=== {_nombre_caso(path)} === (eliminado)")
+                for r in sorted(resultados.values(), key=lambda r: r["caso"]):
+                    if r["correcto"] is False:
+                        print(f"[INCORRECTO] {r['caso']}")
+                    elif r["correcto"] is None and not r["ok"]:
+                        print(f"[FALLO] {r['caso']} (sin EXPECT)")
+                codigo = resumir(list(resultados.values()), list(errores.values()))
+                print(f"[WATCH] {len(cambiados)} caso(s) corridos, {len(borrados)} eliminado(s) "
+                      f"en {(time.perf_counter() - t0) * 1e3:.1f} ms")
+            _esperar(inotify, intervalo)
+    except KeyboardInterrupt:
+        print()
+    finally:
+        if inotify is not None:
+            inotify.close()
+    return codigo
+
+def main(argv=None):
     # Uso:
-    #  - python main.py                -> corre todos
-    #  - python main.py tests/ok/001.c -> corre solo ese (con traza)
-    args = sys.argv[1:]
-    if args:
-        path = args[0]
-        ok = correr_archivo(path, trazar=True)
-        sys.exit(0 if ok else 1)
-
-    total = 0
-    bien = 0
+    #  - python main.py                            -> corre todos
+    #  - python main.py tests/ok/001.c             -> corre solo ese (con traza)
+    #  - python main.py --shard 2/4 --json-out s2.json
+    #  - python main.py merge s1.json s2.json ...  -> resumen combinado
+    #  - python main.py --watch [rutas ...]        -> re-corre lo que cambia
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "merge":
+        ap = argparse.ArgumentParser(prog="main.py merge", description="Combina los JSON de varios shards.")
+        ap.add_argument("jsons", nargs="+", help="Archivos escritos con --json-out")
+        ap.add_argument("--lentos", type=int, default=5, metavar="N", help="Cantidad de casos en la tabla de los más lentos (0: no mostrar)")
+        args = ap.parse_args(argv[1:])
+        sys.exit(merge(args.jsons, args.lentos))
+
+    ap = argparse.ArgumentParser(description="Runner de casos de tests/ para el parser LL(1).")
+    ap.add_argument("path", nargs="?", help="Corre solo este caso, con traza")
+    ap.add_argument("--shard", type=leer_shard, help="Corre solo la partición i/N del corpus")
+    ap.add_argument("--json-out", help="Escribe veredictos, tiempos y diagnósticos en este JSON")
+    ap.add_argument("--lentos", type=int, default=5, metavar="N", help="Cantidad de casos en la tabla de los más lentos (0: no mostrar)")
+    ap.add_argument("--csv", help="Escribe las métricas por archivo en este CSV")
+    ap.add_argument("--xref", help="Escribe en este JSON el índice de referencias de cada caso (ver referencias.py)")
+    ap.add_argument("--watch", nargs="*", metavar="RUTA",
+                    help="Queda vigilando tests/ (y estas rutas) y re-corre solo los casos nuevos o modificados")
+    ap.add_argument("--intervalo", type=float, default=0.25, help="Segundos entre sondeos de --watch sin inotify")
+    args = ap.parse_args(argv)
+
+    if args.watch is not None:
+        sys.exit(vigilar(args.watch, args.intervalo))
+
+    xref = {} if args.xref else None
+    if args.path:
+        r = correr_archivo(args.path, trazar=True, xref=xref)
+        if args.xref:
+            escribir_xref(args.xref, xref)
+        if args.json_out:
+            escribir_json(args.json_out, None, [r], [])
+        sys.exit(0 if r["correcto"] else 1)
+
+    # Carga las gramáticas antes de medir: el primer caso de cada una no paga la compilación
+    for nombre in {GRAMATICA_POR_DEFECTO, *GRAMATICA_POR_CARPETA.values()}:
+        obtener(nombre)
+
+    resultados, errores = [], []
     for path in recolectar_paths():
-        total += 1
+        if not en_shard(path, args.shard):
+            continue
         try:
-            if correr_archivo(path, trazar=False):
-                bien += 1
+            resultados.append(correr_archivo(path, trazar=False, xref=xref))
         except Exception as e:
             print(f"[ERROR] {path}: {e}")
+            errores.append({"caso": os.path.relpath(path, TESTS_DIR).replace(os.sep, "/"), "error": str(e)})
 
-    print(f"\nResumen: {bien}/{total} casos en el resultado esperado.")
-    sys.exit(0 if bien == total else 1)
+    if args.json_out:
+        escribir_json(args.json_out, args.shard, resultados, errores)
+    if args.csv:
+        escribir_csv(args.csv, resultados)
+    if args.xref:
+        escribir_xref(args.xref, xref)
+    reporte_tiempos(resultados, args.lentos)
+    sys.exit(resumir(resultados, errores))
 
 if __name__ == "__main__":
     main()
-
-
@@ -0,0 +1,115 @@
+import json
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ll1_parser import parse
+from semantica import OyenteIdentificadores
+
+# ============================================================
+# Índice de referencias cruzadas (dónde se declara/asigna/usa x)
+#   Se arma en la misma pasada del parser con los roles que ya
+#   calcula OyenteIdentificadores (036): declaración en INIT, destino
+#   en ASSIGN_CORE, uso en PRIMARY. Las ocurrencias quedan en arreglos
+#   paralelos (array) y cada nombre tiene su lista de posiciones en
+#   esos arreglos, así una consulta es un acceso a dict.
+#   El índice es por lexema, no por ligadura: dos variables 'x' en
+#   ámbitos distintos comparten entrada.
+# ============================================================
+
+ROLES = ("decl", "asig", "uso")
+_CODIGO_ROL = {r: k for k, r in enumerate(ROLES)}
+
+@dataclass(frozen=True)
+class Ocurrencia:
+    token: int          # índice en el flujo de tokens
+    linea: int
+    columna: int        # 1-based
+    rol: str
+
+class IndiceReferencias(OyenteIdentificadores):
+    """Oyente de parse() que indexa cada identificador por lexema."""
+
+    def __init__(self, codigo: str = ""):
+        super().__init__()
+        self._codigo = codigo
+        self._i = -1                                 # índice del último token consumido
+        self.token = array("I")
+        self.linea = array("I")
+        self.columna = array("I")
+        self.rol = array("B")
+        self._por_nombre: Dict[str, array] = {}
+
+    def al_consumir(self, X, tok, pila):
+        self._i += 1
+        super().al_consumir(X, tok, pila)
+
+    def al_identificador(self, tok, rol: str):
+        posiciones = self._por_nombre.get(tok.value)
+        if posiciones is None:
+            posiciones = self._por_nombre[tok.value] = array("I")
+        posiciones.append(len(self.token))
+        self.token.append(self._i)
+        self.linea.append(tok.lineno)
+        self.columna.append(tok.lexpos - self._codigo.rfind("\n", 0, tok.lexpos))
+        self.rol.append(_CODIGO_ROL[rol])
+
+    # --- consultas ---
+    def nombres(self) -> List[str]:
+        return list(self._por_nombre)
+
+    def ocurrencias(self, nombre: str, rol: Optional[str] = None) -> List[Ocurrencia]:
+        posiciones = self._por_nombre.get(nombre, ())
+        codigo = None if rol is None else _CODIGO_ROL[rol]
+        return [Ocurrencia(self.token[k], self.linea[k], self.columna[k], ROLES[self.rol[k]])
+                for k in posiciones if codigo is None or self.rol[k] == codigo]
+
+    def declaraciones(self, nombre: str) -> List[Ocurrencia]:
+        return self.ocurrencias(nombre, "decl")
+
+    def asignaciones(self, nombre: str) -> List[Ocurrencia]:
+        return self.ocurrencias(nombre, "asig")
+
+    def usos(self, nombre: str) -> List[Ocurrencia]:
+        return self.ocurrencias(nombre, "uso")
+
+    def __len__(self) -> int:
+        return len(self.token)
+
+    # --- persistencia ---
+    def a_dict(self) -> Dict[str, Any]:
+        """Forma serializable: arreglos paralelos más el nombre (índice en 'nombres') de cada ocurrencia."""
+        nombres = self.nombres()
+        nombre = [0] * len(self.token)
+        for k, n in enumerate(nombres):
+            for pos in self._por_nombre[n]:
+                nombre[pos] = k
+        return {"nombres": nombres, "nombre": nombre, "token": self.token.tolist(),
+                "linea": self.linea.tolist(), "columna": self.columna.tolist(), "rol": self.rol.tolist()}
+
+    @classmethod
+    def desde_dict(cls, d: Dict[str, Any]) -> "IndiceReferencias":
+        idx = cls()
+        idx.token = array("I", d["token"]); idx.linea = array("I", d["linea"])
+        idx.columna = array("I", d["columna"]); idx.rol = array("B", d["rol"])
+        for n in d["nombres"]:
+            idx._por_nombre[n] = array("I")
+        nombres = d["nombres"]
+        for pos, k in enumerate(d["nombre"]):
+            idx._por_nombre[nombres[k]].append(pos)
+        return idx
+
+    def guardar(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.a_dict(), f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def cargar(cls, path: str) -> "IndiceReferencias":
+        with open(path, encoding="utf-8") as f:
+            return cls.desde_dict(json.load(f))
+
+def indexar(codigo: str) -> Tuple[bool, IndiceReferencias]:
+    """Parsea e indexa en una sola pasada. Devuelve (ok, indice)."""
+    idx = IndiceReferencias(codigo)
+    ok = parse(codigo, trazar=False, oyente=idx)
+    return ok, idx
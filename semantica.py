@@ -0,0 +1,114 @@
+from typing import Dict, List, Set, Tuple
+
+from ll1_parser import parse
+
+# ============================================================
+# Chequeo semántico en la misma pasada del parser (sin árbol)
+#   El bucle predictivo notifica a un "oyente" cada match y cada
+#   expansión (parse(..., oyente=...)). Con eso alcanza para:
+#     - saber el rol de cada identificador consumido:
+#         INIT -> id ...            declaración
+#         ASSIGN_CORE -> id = EXPR  destino de asignación
+#         PRIMARY -> id             uso en expresión
+#     - abrir/cerrar ámbitos: { } y el FOR_STMT completo (las
+#       variables declaradas en el init del for son locales a él).
+#   ComprobadorDeclaraciones mantiene la tabla de símbolos por
+#   ámbitos con búsquedas O(1) y reporta no declarados/redeclarados.
+# ============================================================
+
+class Oyente:
+    """Observador del bucle predictivo; los métodos reciben la pila ya actualizada."""
+
+    def al_expandir(self, A, produccion, tok, pila):
+        pass
+
+    def al_consumir(self, X, tok, pila):
+        pass
+
+class OyenteIdentificadores(Oyente):
+    """Traduce los eventos del parser a identificadores con rol y a ámbitos."""
+
+    DECLARACION, ASIGNACION, USO = "decl", "asig", "uso"
+
+    def __init__(self):
+        self._rol = None
+        self._fors: List[int] = []   # índice de pila de cada FOR_STMT abierto
+
+    # --- a redefinir ---
+    def al_identificador(self, tok, rol: str):
+        pass
+
+    def abrir_ambito(self):
+        pass
+
+    def cerrar_ambito(self):
+        pass
+
+    # --- eventos del parser ---
+    def al_expandir(self, A, produccion, tok, pila):
+        if A == 'INIT':
+            self._rol = self.DECLARACION
+        elif A == 'ASSIGN_CORE':
+            self._rol = self.ASIGNACION
+        elif A == 'PRIMARY' and produccion[0] == 'identificador':
+            self._rol = self.USO
+        elif A == 'FOR_STMT':
+            # FOR_STMT ocupaba pila[len(pila) - len(produccion)]; termina al volver a esa altura
+            self._fors.append(len(pila) - len(produccion))
+            self.abrir_ambito()
+        self._cerrar_fors(pila)
+
+    def al_consumir(self, X, tok, pila):
+        if X == 'identificador':
+            rol, self._rol = self._rol, None
+            if rol is not None:
+                self.al_identificador(tok, rol)
+        elif X == 'inicioBloque':
+            self.abrir_ambito()
+        elif X == 'finBloque':
+            self.cerrar_ambito()
+        self._cerrar_fors(pila)
+
+    def _cerrar_fors(self, pila):
+        while self._fors and len(pila) <= self._fors[-1]:
+            self._fors.pop()
+            self.cerrar_ambito()
+
+class ComprobadorDeclaraciones(OyenteIdentificadores):
+    """Tabla de símbolos por ámbitos: reporta identificadores no declarados y redeclarados."""
+
+    def __init__(self):
+        super().__init__()
+        self._ambitos: List[Set[str]] = [set()]
+        self._visibles: Dict[str, int] = {}     # nombre -> cuántos ámbitos abiertos lo declaran
+        self.diagnosticos: List[str] = []
+
+    def abrir_ambito(self):
+        self._ambitos.append(set())
+
+    def cerrar_ambito(self):
+        for nombre in self._ambitos.pop():
+            n = self._visibles[nombre] - 1
+            if n:
+                self._visibles[nombre] = n
+            else:
+                del self._visibles[nombre]
+
+    def al_identificador(self, tok, rol: str):
+        nombre = tok.value
+        if rol == self.DECLARACION:
+            ambito = self._ambitos[-1]
+            if nombre in ambito:
+                self.diagnosticos.append(f"[SEM] línea {tok.lineno}: '{nombre}' redeclarado en el mismo ámbito")
+                return
+            ambito.add(nombre)
+            self._visibles[nombre] = self._visibles.get(nombre, 0) + 1
+        elif nombre not in self._visibles:
+            uso = "asignado" if rol == self.ASIGNACION else "usado"
+            self.diagnosticos.append(f"[SEM] línea {tok.lineno}: '{nombre}' {uso} sin declarar")
+
+def comprobar(codigo: str) -> Tuple[bool, List[str]]:
+    """Parsea y chequea declaraciones en una sola pasada. Devuelve (ok_sintaxis, diagnosticos)."""
+    comp = ComprobadorDeclaraciones()
+    ok = parse(codigo, trazar=False, oyente=comp)
+    return ok, comp.diagnosticos
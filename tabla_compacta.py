@@ -0,0 +1,103 @@
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from ll1_parser import tabla_ll1
+
+# ============================================================
+# Tabla LL(1) comprimida
+#   - Símbolos a códigos enteros (No Terminales y terminales).
+#   - Producciones internadas: una tupla por RHS distinto (sin
+#     'vacia'; ε es la tupla vacía), compartida por todas las celdas.
+#   - Filas "uniformes" (todas sus celdas con la misma producción,
+#     p.ej. EXPR, OR_EXPR, ..., MUL_EXPR) guardan esa producción como
+#     default del No Terminal; así varias filas quedan idénticas y se
+#     deduplican por su patrón de lookahead.
+#   - Las filas únicas se empaquetan por desplazamiento de filas
+#     (comb / row displacement) en tres arreglos planos:
+#         base[f]          inicio de la fila f
+#         check[base+t]    fila dueña de la celda (o -1)
+#         valor[base+t]    id de producción + 1 (0 = default del NT)
+#   Búsqueda O(1): dos índices y una comparación.
+# ============================================================
+
+class TablaCompacta:
+    """Tabla LL(1) empaquetada; `buscar(A, a)` equivale a `_indice.get((A, a))`."""
+
+    def __init__(self, tabla=tabla_ll1):
+        self.no_terminales: List[str] = []
+        self.terminales: List[str] = []
+        self.cod_nt: Dict[str, int] = {}
+        self.cod_t: Dict[str, int] = {}
+        self.producciones: List[Tuple[str, ...]] = []
+        ids_prod: Dict[Tuple[str, ...], int] = {}
+
+        celdas: Dict[str, Dict[int, int]] = {}
+        for A, a, prod in tabla:
+            if A not in self.cod_nt:
+                self.cod_nt[A] = len(self.no_terminales); self.no_terminales.append(A)
+            if a not in self.cod_t:
+                self.cod_t[a] = len(self.terminales); self.terminales.append(a)
+            rhs = tuple(s for s in prod if s != 'vacia')
+            if rhs not in ids_prod:
+                ids_prod[rhs] = len(self.producciones); self.producciones.append(rhs)
+            celdas.setdefault(A, {})[self.cod_t[a]] = ids_prod[rhs]
+
+        n_nt = len(self.no_terminales)
+        self.defecto = array('h', [-1] * n_nt)
+        self.fila = array('H', [0] * n_nt)
+        filas: Dict[Tuple[Tuple[int, int], ...], int] = {}
+        for A, por_t in celdas.items():
+            nt = self.cod_nt[A]
+            distintas = set(por_t.values())
+            if len(distintas) == 1:
+                self.defecto[nt] = distintas.pop()
+                clave = tuple(sorted((t, 0) for t in por_t))
+            else:
+                clave = tuple(sorted((t, p + 1) for t, p in por_t.items()))
+            if clave not in filas:
+                filas[clave] = len(filas)
+            self.fila[nt] = filas[clave]
+
+        self.base, self.check, self.valor = _empaquetar(list(filas), len(self.terminales))
+        self.filas_unicas = len(filas)
+
+    def buscar_codigos(self, nt: int, t: int) -> Optional[Tuple[str, ...]]:
+        f = self.fila[nt]
+        k = self.base[f] + t
+        if self.check[k] != f:
+            return None
+        v = self.valor[k]
+        return self.producciones[self.defecto[nt] if v == 0 else v - 1]
+
+    def buscar(self, A: str, a: str) -> Optional[Tuple[str, ...]]:
+        """RHS (tupla sin 'vacia') para M[A][a], o None si la celda está vacía."""
+        nt = self.cod_nt.get(A)
+        t = self.cod_t.get(a)
+        if nt is None or t is None:
+            return None
+        return self.buscar_codigos(nt, t)
+
+def _empaquetar(filas, n_terminales: int):
+    """Row displacement first-fit: las filas más densas primero."""
+    orden = sorted(range(len(filas)), key=lambda f: -len(filas[f]))
+    base = array('i', [0] * len(filas))
+    check = array('h', [-1] * n_terminales)
+    valor = array('H', [0] * n_terminales)
+    for f in orden:
+        celdas = filas[f]
+        b = 0
+        while any(b + t < len(check) and check[b + t] != -1 for t, _ in celdas):
+            b += 1
+        # toda base debe poder indexarse con cualquier terminal
+        falta = b + n_terminales - len(check)
+        if falta > 0:
+            check.extend([-1] * falta)
+            valor.extend([0] * falta)
+        for t, v in celdas:
+            check[b + t] = f
+            valor[b + t] = v
+        base[f] = b
+    return base, check, valor
+
+def compactar(tabla=tabla_ll1) -> TablaCompacta:
+    return TablaCompacta(tabla)
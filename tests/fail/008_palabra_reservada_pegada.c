@@ -0,0 +1 @@
+intx;
@@ -0,0 +1,12 @@
+// identificadores que empiezan con una palabra reservada
+int integer, format;
+double doubled;
+char charset, iffy;
+float floaty, elsewhere, whiley, forty, voidness;
+
+integer = 1;
+format = integer + 2;
+iffy = format;
+for (int fori = 0; fori < forty; fori = fori + 1) {
+    if (iffy) elsewhere = whiley; else doubled = charset;
+}
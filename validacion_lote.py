@@ -0,0 +1,230 @@
+from array import array
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # dependencia opcional: solo este módulo la usa
+    np = None
+
+from c_lexer import lexer
+from gramaticas import obtener, GRAMATICA_POR_DEFECTO
+from ll1_parser import tabla_ll1, _tokenizar
+from ll1_codegen import cargar
+
+# ============================================================
+# Validación por lotes: pre-filtro vectorizado con NumPy
+#   1) Cada entrada se tokeniza a un arreglo de códigos enteros.
+#   2) Chequeos baratos sobre el lote completo (concatenado):
+#        - ( ) y { } balanceados (sumas acumuladas por segmento)
+#        - bigramas de tokens adyacentes permitidos por la
+#          relación FIRST/FOLLOW de la gramática
+#        - primer token dentro de FIRST(S)
+#   3) Lo que el filtro no descarta pasa por el parser predictivo
+#      completo (el generado por ll1_codegen, sobre los mismos
+#      tokens: no se vuelve a lexear).
+#   El filtro solo rechaza: nunca acepta por sí mismo, así que el
+#   veredicto final es idéntico al de `parse`.
+#   Costo: el lexeo domina y el parser generado rechaza pronto, así que
+#   el filtro solo ahorra el parse de los inválidos. En tests/ok+fail
+#   eso son unos pocos ms contra ~25 ms de armar los códigos y correr
+#   los chequeos (sobre ~300 ms de lexeo): validar_lote no es más
+#   rápido que lexear + parser generado sin filtro, y en promedio es
+#   algo más lento (bench/bench_lote.py). Paga solo si los inválidos
+#   son largos y fallan tarde. Por eso es opcional: validar_lote(...,
+#   prefiltro=True); sin él no hace falta NumPy.
+#   Todo se arma por gramática registrada (`gramatica=`): códigos,
+#   matriz de bigramas, lexer y parser generado.
+# ============================================================
+
+def codigos(gramatica: str = GRAMATICA_POR_DEFECTO) -> Dict[str, int]:
+    """{terminal: código entero} en el orden de `tokens` de la gramática."""
+    return {t: k for k, t in enumerate(obtener(gramatica).tokens)}
+
+CODIGOS: Dict[str, int] = codigos()
+_BALANCEADOS = (('LPAREN', 'RPAREN'), ('inicioBloque', 'finBloque'))
+
+def _producciones(tabla):
+    """{A: {rhs...}} sin repetir (la tabla repite la misma producción por terminal)."""
+    prods: Dict[str, Set[Tuple[str, ...]]] = {}
+    for A, _, prod in tabla:
+        prods.setdefault(A, set()).add(tuple(s for s in prod if s != 'vacia'))
+    return prods
+
+def _first_seq(seq, prods, first, anulables):
+    """FIRST de una secuencia de símbolos y si es anulable."""
+    out = set()
+    for s in seq:
+        if s not in prods:
+            out.add(s)
+            return out, False
+        out |= first[s]
+        if s not in anulables:
+            return out, False
+    return out, True
+
+def first_follow(tabla=tabla_ll1, inicial: str = 'S'):
+    """Calcula (FIRST, FOLLOW, anulables) de los No Terminales de `tabla`."""
+    prods = _producciones(tabla)
+    first: Dict[str, Set[str]] = {A: set() for A in prods}
+    follow: Dict[str, Set[str]] = {A: set() for A in prods}
+    anulables: Set[str] = set()
+    follow[inicial].add('eof')
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for A, rhss in prods.items():
+            for rhs in rhss:
+                f, anulable = _first_seq(rhs, prods, first, anulables)
+                if not f <= first[A]:
+                    first[A] |= f; cambio = True
+                if anulable and A not in anulables:
+                    anulables.add(A); cambio = True
+                for k, s in enumerate(rhs):
+                    if s not in prods:
+                        continue
+                    f, anulable = _first_seq(rhs[k + 1:], prods, first, anulables)
+                    if anulable:
+                        f = f | follow[A]
+                    if not f <= follow[s]:
+                        follow[s] |= f; cambio = True
+    return first, follow, anulables
+
+def bigramas_legales(tabla=tabla_ll1, inicial: str = 'S') -> Tuple[Set[Tuple[str, str]], FrozenSet[str]]:
+    """Pares (a, b) de terminales que pueden aparecer adyacentes y terminales iniciales.
+
+    Es una sobre-aproximación segura: todo par que ocurre en una entrada
+    aceptada está en el conjunto (FOLLOW no distingue contextos).
+    """
+    prods = _producciones(tabla)
+    first, follow, anulables = first_follow(tabla, inicial)
+
+    pares: Set[Tuple[str, str]] = set()
+    for A, rhss in prods.items():
+        for rhs in rhss:
+            for k, s in enumerate(rhs):
+                if s in prods:
+                    continue
+                f, anulable = _first_seq(rhs[k + 1:], prods, first, anulables)
+                if anulable:
+                    f = f | follow[A]
+                pares.update((s, b) for b in f)
+    iniciales = first[inicial] | ({'eof'} if inicial in anulables else set())
+    return pares, frozenset(iniciales)
+
+_tablas = {}   # gramática -> (códigos, matriz de bigramas, vector de iniciales)
+
+def _tablas_np(gramatica: str = GRAMATICA_POR_DEFECTO):
+    """Códigos, matriz booleana [T, T] de bigramas y vector de iniciales (una vez por gramática)."""
+    t = _tablas.get(gramatica)
+    if t is None:
+        g = obtener(gramatica)
+        cod = codigos(gramatica)
+        pares, iniciales = bigramas_legales(g.tabla, g.inicial)
+        n = len(cod)
+        m = np.zeros((n, n), dtype=bool)
+        for a, b in pares:
+            m[cod[a], cod[b]] = True
+        v = np.zeros(n, dtype=bool)
+        for a in iniciales:
+            v[cod[a]] = True
+        t = _tablas[gramatica] = (cod, m, v)
+    return t
+
+def _requiere_numpy():
+    if np is None:
+        raise ImportError("validacion_lote requiere NumPy (pip install numpy)")
+
+def _tipos(codigo: str, lx=lexer) -> Optional[List[str]]:
+    """Tipos de token hasta el primer 'eof' (incluido); lo que sigue no lo mira `parse`.
+
+    None si el lexer abortó por exceso de errores (`parse` devuelve False).
+    """
+    tipos = [t.type for t in _tokenizar(codigo, lx)]
+    if lx.abortado:
+        return None
+    return tipos[:tipos.index('eof') + 1]
+
+def lexear_codigos(codigo: str, gramatica: str = GRAMATICA_POR_DEFECTO):
+    """Tokeniza `codigo` a un arreglo int16 de códigos, cortado en el primer 'eof' (incluido).
+
+    None si el lexer abortó por exceso de errores.
+    """
+    _requiere_numpy()
+    cod = _tablas_np(gramatica)[0]
+    tipos = _tipos(codigo, obtener(gramatica).lexer)
+    return None if tipos is None else np.array([cod[t] for t in tipos], dtype=np.int16)
+
+def prefiltrar(arreglos: List["np.ndarray"], gramatica: str = GRAMATICA_POR_DEFECTO):
+    """Devuelve un arreglo bool: False = inválido seguro, True = no decidido.
+
+    Los elementos None (lexer abortado) se marcan inválidos.
+    """
+    _requiere_numpy()
+    lexeados = np.array([a is not None for a in arreglos], dtype=bool)
+    arreglos = [a for a in arreglos if a is not None]
+    if not arreglos:
+        return lexeados
+    largos = np.fromiter((len(a) for a in arreglos), dtype=np.int64, count=len(arreglos))
+    lexeados[lexeados] = _prefiltrar_segmentos(np.concatenate(arreglos), largos, gramatica)
+    return lexeados
+
+def _prefiltrar_segmentos(cat, largos, gramatica: str = GRAMATICA_POR_DEFECTO):
+    """Como prefiltrar, sobre el lote ya concatenado (`largos`: tokens de cada segmento)."""
+    cod, matriz, iniciales = _tablas_np(gramatica)
+    inicio = np.concatenate(([0], np.cumsum(largos)[:-1]))
+    fin = inicio + largos - 1
+    cat = cat.astype(np.intp)
+
+    posibles = iniciales[cat[inicio]]
+
+    for abre, cierra in _BALANCEADOS:
+        if abre not in cod or cierra not in cod:     # la gramática no tiene ese par
+            continue
+        delta = (cat == cod[abre]).astype(np.int32) - (cat == cod[cierra])
+        acum = np.cumsum(delta)
+        base = np.repeat(acum[inicio] - delta[inicio], largos)
+        local = acum - base
+        posibles &= np.minimum.reduceat(local, inicio) >= 0
+        posibles &= local[fin] == 0
+
+    # Par (i, i+1) dentro del segmento; el último de cada segmento no forma par.
+    pares = np.ones(len(cat), dtype=bool)
+    pares[:-1] = matriz[cat[:-1], cat[1:]]
+    pares[fin] = True
+    posibles &= np.logical_and.reduceat(pares, inicio)
+    return posibles
+
+def validar_lote(fuentes: List[str], prefiltro: bool = False, gramatica: str = GRAMATICA_POR_DEFECTO):
+    """Valida muchas entradas. Devuelve (veredictos, {"total", "decididos_por_filtro"}).
+
+    Por defecto lexea y pasa cada entrada por el parser generado. Con
+    prefiltro=True corre antes los chequeos NumPy (ver arriba: en el
+    corpus del repo no compensan su costo).
+    """
+    reconocer = cargar(gramatica=gramatica).reconocer
+    lx = obtener(gramatica).lexer
+    if not prefiltro:
+        tipos = [_tipos(src, lx) for src in fuentes]
+        return [ts is not None and reconocer(ts) for ts in tipos], {"total": len(fuentes), "decididos_por_filtro": 0}
+    _requiere_numpy()
+    # Los códigos de todo el lote van a un único array('h') mientras se lexea:
+    # sin un np.array por archivo ni concatenación posterior.
+    codigo = _tablas_np(gramatica)[0].__getitem__
+    cat, largos, lexeados = array('h'), [], []
+    tipos = []
+    for src in fuentes:
+        ts = _tipos(src, lx)
+        tipos.append(ts)
+        if ts is not None:
+            cat.extend(map(codigo, ts))
+            largos.append(len(ts))
+            lexeados.append(len(tipos) - 1)
+    posibles = np.zeros(len(fuentes), dtype=bool)
+    if largos:
+        posibles[lexeados] = _prefiltrar_segmentos(np.frombuffer(cat, dtype=np.int16),
+                                                   np.array(largos, dtype=np.int64), gramatica)
+    veredictos = [False] * len(fuentes)
+    for k in np.flatnonzero(posibles):
+        veredictos[k] = reconocer(tipos[k])
+    return veredictos, {"total": len(fuentes), "decididos_por_filtro": int(len(fuentes) - posibles.sum())}
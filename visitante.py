@@ -0,0 +1,107 @@
+from typing import Any, Callable, Dict, List, Optional
+
+from ll1_parser_tree import Node
+
+# ============================================================
+# Visitantes sobre el árbol de derivación
+#   class Contador(Visitante):
+#       def visit_DECL(self, n): ...            # al entrar
+#       def leave_BLOCK(self, n): ...           # al salir
+#   Contador().recorrer(raiz)
+#
+#   La tabla label -> método se arma una vez por clase (al definirla),
+#   no con comparaciones de strings ni getattr por nodo. El recorrido
+#   es iterativo (sin límite de recursión) y un visit_X que devuelve
+#   PODAR saltea los hijos de ese nodo (su leave_X igual se llama).
+#   Sirve para Node y para cualquier objeto con label/children
+#   (p.ej. arbol_binario.NodoVista).
+# ============================================================
+
+PODAR = object()
+
+def _tabla(cls, prefijo: str) -> Dict[str, Callable]:
+    return {nombre[len(prefijo):]: getattr(cls, nombre)
+            for nombre in dir(cls) if nombre.startswith(prefijo) and nombre != prefijo + "default"}
+
+class Visitante:
+    """Base de los recorridos: definir visit_<LABEL>/leave_<LABEL> (y opcionalmente *_default)."""
+
+    _entrar: Dict[str, Callable] = {}
+    _salir: Dict[str, Callable] = {}
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        cls._entrar = _tabla(cls, "visit_")
+        cls._salir = _tabla(cls, "leave_")
+
+    # Llamados para labels sin método propio; None = no hacer nada
+    visit_default: Optional[Callable] = None
+    leave_default: Optional[Callable] = None
+
+    def recorrer(self, raiz) -> "Visitante":
+        entrar, salir = self._entrar, self._salir
+        e_def, s_def = type(self).visit_default, type(self).leave_default
+        pila: List[Any] = [raiz]
+        while pila:
+            n = pila.pop()
+            if n.__class__ is _Salida:
+                n = n.nodo
+                f = salir.get(n.label, s_def)
+                if f is not None:
+                    f(self, n)
+                continue
+            label = n.label
+            f = entrar.get(label, e_def)
+            podar = f is not None and f(self, n) is PODAR
+            if label in salir or s_def is not None:
+                pila.append(_Salida(n))
+            if not podar and n.children:
+                pila.extend(reversed(n.children))
+        return self
+
+class _Salida:
+    __slots__ = ("nodo",)
+
+    def __init__(self, nodo):
+        self.nodo = nodo
+
+_ENTRAR, _HIJOS, _PODADO = object(), object(), object()
+
+class Transformador(Visitante):
+    """Recorrido en postorden que reconstruye el árbol.
+
+    leave_<LABEL>(n) recibe el nodo con los hijos ya transformados y devuelve
+    su reemplazo (None: se elimina del padre). Sin leave_<LABEL> queda igual.
+    Los nodos con algún hijo cambiado se copian: el árbol original no se
+    modifica (vale también para árboles con subárboles compartidos, ver internado.py).
+    Requiere Nodes: los resultados de los hijos se asocian por id().
+    """
+
+    def transformar(self, raiz):
+        entrar, e_def = self._entrar, type(self).visit_default
+        salir, s_def = self._salir, type(self).leave_default
+        hecho: Dict[int, Any] = {}                  # id(nodo original) -> reemplazo
+        pila: List[Any] = [(raiz, _ENTRAR)]
+        while pila:
+            n, estado = pila.pop()
+            if estado is _ENTRAR:
+                f = entrar.get(n.label, e_def)
+                if f is not None and f(self, n) is PODAR:
+                    pila.append((n, _PODADO))
+                else:
+                    pila.append((n, _HIJOS))
+                    pila.extend((c, _ENTRAR) for c in reversed(n.children))
+                continue
+            original = n
+            if estado is _HIJOS and n.children:
+                nuevos, cambio = [], False
+                for c in n.children:
+                    h = hecho[id(c)]
+                    cambio = cambio or h is not c
+                    if h is not None:
+                        nuevos.append(h)
+                if cambio:
+                    n = Node(n.label, n.token_type, n.lexeme, nuevos)
+            f = salir.get(n.label, s_def)
+            hecho[id(original)] = n if f is None else f(self, n)
+        return hecho[id(raiz)]